@@ -6,8 +6,11 @@ This server provides access to Israeli government real estate data through the G
 using the FastMCP library with simplified, working functions.
 """
 
-import json
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 import logging
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
@@ -17,6 +20,7 @@ from nadlan_mcp.config import get_config
 from nadlan_mcp.govmap import GovmapClient
 from nadlan_mcp.govmap.models import Deal
 from nadlan_mcp.govmap.outlier_detection import filter_deals_for_analysis
+from nadlan_mcp.json_utils import dumps
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -28,6 +32,9 @@ mcp = FastMCP("nadlan-mcp")
 # Initialize the Govmap client
 client = GovmapClient()
 
+# Upper bound on addresses compare_addresses looks up at the same time
+_COMPARE_MAX_WORKERS = 4
+
 
 def conditional_tool(config_flag: str):
     """
@@ -45,7 +52,7 @@ def conditional_tool(config_flag: str):
             return mcp.tool()(func)
         else:
             # Don't register, just return the function unchanged
-            logger.info(f"Tool {func.__name__} is DISABLED (config: {config_flag})")
+            logger.info("Tool %s is DISABLED (config: %s)", func.__name__, config_flag)
             return func
 
     return decorator
@@ -59,6 +66,10 @@ def log_mcp_call(func_name: str, **params):
         func_name: Name of the MCP tool function being called
         **params: Keyword arguments passed to the function
     """
+    # Skip the parameter formatting entirely when INFO logging is off
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     # Format parameters for logging (truncate long strings)
     formatted_params = {}
     for key, value in params.items():
@@ -70,10 +81,22 @@ def log_mcp_call(func_name: str, **params):
             formatted_params[key] = value
 
     logger.info(
-        f"MCP tool called: {func_name}({', '.join(f'{k}={v}' for k, v in formatted_params.items())})"
+        "MCP tool called: %s(%s)",
+        func_name,
+        ", ".join(f"{k}={v}" for k, v in formatted_params.items()),
     )
 
 
+def _deal_type_description(deal_type: int) -> str:
+    """Human-readable label for a Govmap deal type (1=first hand, 2=second hand)."""
+    return "first hand (new)" if deal_type == 1 else "second hand (used)"
+
+
+def _no_deals_message(deal_type: int, context: str) -> str:
+    """Shared zero-deal response, returned before any stats or serialization work."""
+    return f"No {_deal_type_description(deal_type)} deals found {context}"
+
+
 def strip_bloat_fields(deals: List[Deal], lang: str = "he") -> List[Dict[str, Any]]:
     """
     Remove bloat fields from Deal models to reduce token usage in MCP responses.
@@ -157,6 +180,10 @@ def autocomplete_address(search_text: str) -> str:
         JSON string containing matching addresses with their coordinates
     """
     log_mcp_call("autocomplete_address", search_text=search_text)
+    # Too short to match anything useful - answer without a Govmap round trip
+    if len((search_text or "").strip()) < 2:
+        return "Please provide at least 2 characters to search"
+
     try:
         response = client.autocomplete_address(search_text)
 
@@ -182,10 +209,10 @@ def autocomplete_address(search_text: str) -> str:
 
             formatted_results.append(result_dict)
 
-        return json.dumps(formatted_results, ensure_ascii=False, indent=None)
+        return dumps(formatted_results)
 
     except Exception as e:
-        logger.error(f"Error in autocomplete_address: {e}", exc_info=True)
+        logger.error("Error in autocomplete_address: %s", e, exc_info=True)
         return f"Error searching for address: {str(e)}"
 
 
@@ -207,6 +234,9 @@ def get_deals_by_radius(latitude: float, longitude: float, radius_meters: int =
     log_mcp_call(
         "get_deals_by_radius", latitude=latitude, longitude=longitude, radius_meters=radius_meters
     )
+    if radius_meters <= 0:
+        return "radius_meters must be positive"
+
     try:
         # Note: GovmapClient expects (longitude, latitude) tuple
         # Returns polygon metadata dicts, not Deal objects
@@ -215,19 +245,17 @@ def get_deals_by_radius(latitude: float, longitude: float, radius_meters: int =
         if not polygons:
             return f"No polygons found within {radius_meters}m of coordinates ({latitude}, {longitude})"
 
-        return json.dumps(
+        return dumps(
             {
                 "total_polygons": len(polygons),
                 "search_radius_meters": radius_meters,
                 "center_coordinates": {"latitude": latitude, "longitude": longitude},
                 "polygons": polygons,  # Return dicts directly, no stripping needed
-            },
-            ensure_ascii=False,
-            indent=None,
+            }
         )
 
     except Exception as e:
-        logger.error(f"Error in get_deals_by_radius: {e}", exc_info=True)
+        logger.error("Error in get_deals_by_radius: %s", e, exc_info=True)
         return f"Error fetching polygons by radius: {str(e)}"
 
 
@@ -248,8 +276,7 @@ def get_street_deals(polygon_id: str, limit: int = 100, deal_type: int = 2) -> s
         deals = client.get_street_deals(polygon_id, limit, deal_type=deal_type)
 
         if not deals:
-            deal_type_desc = "first hand (new)" if deal_type == 1 else "second hand (used)"
-            return f"No {deal_type_desc} deals found for polygon ID {polygon_id}"
+            return _no_deals_message(deal_type, f"for polygon ID {polygon_id}")
 
         # Add deal type metadata
         for deal in deals:
@@ -269,8 +296,8 @@ def get_street_deals(polygon_id: str, limit: int = 100, deal_type: int = 2) -> s
                 "max_price_per_sqm": round(max(price_per_sqm_values), 0),
             }
 
-        deal_type_desc = "first hand (new)" if deal_type == 1 else "second hand (used)"
-        return json.dumps(
+        deal_type_desc = _deal_type_description(deal_type)
+        return dumps(
             {
                 "total_deals": len(deals),
                 "polygon_id": polygon_id,
@@ -278,13 +305,11 @@ def get_street_deals(polygon_id: str, limit: int = 100, deal_type: int = 2) -> s
                 "deal_type_description": deal_type_desc,
                 "market_statistics": stats,
                 "deals": strip_bloat_fields(deals, lang="he"),
-            },
-            ensure_ascii=False,
-            indent=None,
+            }
         )
 
     except Exception as e:
-        logger.error(f"Error in get_street_deals: {e}", exc_info=True)
+        logger.error("Error in get_street_deals: %s", e, exc_info=True)
         return f"Error fetching street deals: {str(e)}"
 
 
@@ -334,8 +359,7 @@ def find_recent_deals_for_address(
         )
 
         if not deals:
-            deal_type_desc = "first hand (new)" if deal_type == 1 else "second hand (used)"
-            return f"No {deal_type_desc} deals found for address '{address}'"
+            return _no_deals_message(deal_type, f"for address '{address}'")
 
         # Calculate comprehensive statistics using model attributes
         prices = [deal.deal_amount for deal in deals if deal.deal_amount]
@@ -398,7 +422,7 @@ def find_recent_deals_for_address(
                 else 0,
             }
 
-        deal_type_desc = "first hand (new)" if deal_type == 1 else "second hand (used)"
+        deal_type_desc = _deal_type_description(deal_type)
         search_params = {
             "address": address,
             "years_back": years_back,
@@ -410,18 +434,16 @@ def find_recent_deals_for_address(
         if search_coords:
             search_params["search_coordinates"] = search_coords
 
-        return json.dumps(
+        return dumps(
             {
                 "search_parameters": search_params,
                 "market_statistics": stats,
                 "deals": strip_bloat_fields(deals, lang=lang),
-            },
-            ensure_ascii=False,
-            indent=None,
+            }
         )
 
     except Exception as e:
-        logger.error(f"Error in find_recent_deals_for_address: {e}", exc_info=True)
+        logger.error("Error in find_recent_deals_for_address: %s", e, exc_info=True)
         return f"Error analyzing address: {str(e)}"
 
 
@@ -445,8 +467,7 @@ def get_neighborhood_deals(
         deals = client.get_neighborhood_deals(polygon_id, limit, deal_type=deal_type)
 
         if not deals:
-            deal_type_desc = "first hand (new)" if deal_type == 1 else "second hand (used)"
-            return f"No {deal_type_desc} deals found for polygon ID {polygon_id}"
+            return _no_deals_message(deal_type, f"for polygon ID {polygon_id}")
 
         # Add deal type metadata
         for deal in deals:
@@ -466,8 +487,8 @@ def get_neighborhood_deals(
                 "max_price_per_sqm": round(max(price_per_sqm_values), 0),
             }
 
-        deal_type_desc = "first hand (new)" if deal_type == 1 else "second hand (used)"
-        return json.dumps(
+        deal_type_desc = _deal_type_description(deal_type)
+        return dumps(
             {
                 "total_deals": len(deals),
                 "polygon_id": polygon_id,
@@ -475,13 +496,11 @@ def get_neighborhood_deals(
                 "deal_type_description": deal_type_desc,
                 "market_statistics": stats,
                 "deals": strip_bloat_fields(deals, lang=lang),
-            },
-            ensure_ascii=False,
-            indent=None,
+            }
         )
 
     except Exception as e:
-        logger.error(f"Error in get_neighborhood_deals: {e}", exc_info=True)
+        logger.error("Error in get_neighborhood_deals: %s", e, exc_info=True)
         return f"Error fetching neighborhood deals: {str(e)}"
 
 
@@ -530,13 +549,12 @@ def analyze_market_trends(
         )
 
         if not deals:
-            deal_type_desc = "first hand (new)" if deal_type == 1 else "second hand (used)"
-            return f"No {deal_type_desc} deals found for comprehensive market analysis near '{address}'"
-
-        # Efficient analysis with reduced complexity
-        from collections import defaultdict
+            return _no_deals_message(
+                deal_type, f"for comprehensive market analysis near '{address}'"
+            )
 
-        yearly_data = defaultdict(list)
+        # Running per-year accumulators (single pass, no per-deal dicts kept around)
+        yearly_totals: Dict[int, Dict[str, float]] = {}
         property_types: Dict[str, List[float]] = defaultdict(
             list
         )  # Store only prices for efficiency
@@ -547,15 +565,14 @@ def analyze_market_trends(
             if not deal.deal_date:
                 continue
 
-            # Convert date to string for parsing
-            from datetime import date as date_type
-
-            date_str = (
-                deal.deal_date.isoformat()
-                if isinstance(deal.deal_date, date_type)
-                else str(deal.deal_date)
-            )
-            year = date_str[:4]
+            # Integer year keys: read straight from the date, no string round-trip
+            if isinstance(deal.deal_date, date):
+                year = deal.deal_date.year
+            else:
+                try:
+                    year = int(str(deal.deal_date)[:4])
+                except ValueError:
+                    continue
             price = deal.deal_amount
             area = deal.asset_area
             price_per_sqm = deal.price_per_sqm
@@ -569,70 +586,79 @@ def analyze_market_trends(
                 and area > 0
                 and isinstance(price_per_sqm, (int, float))
             ):
-                yearly_data[year].append(
-                    {
-                        "price": price,
-                        "area": area,
-                        "price_per_sqm": price_per_sqm,
-                        "deal_source": deal_source,
+                totals = yearly_totals.get(year)
+                if totals is None:
+                    totals = yearly_totals[year] = {
+                        "deal_count": 0,
+                        "same_building_deals": 0,
+                        "street_deals": 0,
+                        "price_sum": 0.0,
+                        "price_per_sqm_sum": 0.0,
+                        "min_price_per_sqm": price_per_sqm,
+                        "max_price_per_sqm": price_per_sqm,
                     }
-                )
+                totals["deal_count"] += 1
+                if deal_source == "same_building":
+                    totals["same_building_deals"] += 1
+                elif deal_source == "street":
+                    totals["street_deals"] += 1
+                totals["price_sum"] += price
+                totals["price_per_sqm_sum"] += price_per_sqm
+                if price_per_sqm < totals["min_price_per_sqm"]:
+                    totals["min_price_per_sqm"] = price_per_sqm
+                if price_per_sqm > totals["max_price_per_sqm"]:
+                    totals["max_price_per_sqm"] = price_per_sqm
+
                 property_types[prop_type].append(price_per_sqm)
                 neighborhoods[neighborhood].append(price_per_sqm)
 
-        # Calculate streamlined yearly trends
+        # Calculate streamlined yearly trends from the accumulated totals
+        # (keys become strings only here, for the JSON response)
         yearly_trends = {}
-        for year, year_deals in yearly_data.items():
-            if year_deals:
-                prices = [d["price"] for d in year_deals]
-                price_per_sqm_vals = [d["price_per_sqm"] for d in year_deals]
-                building_deals = [d for d in year_deals if d["deal_source"] == "same_building"]
-                street_deals = [d for d in year_deals if d["deal_source"] == "street"]
-
-                yearly_trends[year] = {
-                    "deal_count": len(year_deals),
-                    "same_building_deals": len(building_deals),
-                    "street_deals": len(street_deals),
-                    "avg_price": round(sum(prices) / len(prices), 0),
-                    "avg_price_per_sqm": round(
-                        sum(price_per_sqm_vals) / len(price_per_sqm_vals), 0
-                    ),
-                    "min_price_per_sqm": round(min(price_per_sqm_vals), 0),
-                    "max_price_per_sqm": round(max(price_per_sqm_vals), 0),
-                    "total_volume": sum(prices),
-                }
-
-        # Streamlined property type analysis (top 5 only)
-        property_type_analysis = {}
-        for prop_type, prices_per_sqm in property_types.items():
-            if len(prices_per_sqm) >= 2:  # Only include types with multiple deals
-                property_type_analysis[prop_type] = {
-                    "deal_count": len(prices_per_sqm),
-                    "avg_price_per_sqm": round(sum(prices_per_sqm) / len(prices_per_sqm), 0),
-                }
+        for year, totals in yearly_totals.items():
+            count = totals["deal_count"]
+            yearly_trends[str(year)] = {
+                "deal_count": count,
+                "same_building_deals": totals["same_building_deals"],
+                "street_deals": totals["street_deals"],
+                "avg_price": round(totals["price_sum"] / count, 0),
+                "avg_price_per_sqm": round(totals["price_per_sqm_sum"] / count, 0),
+                "min_price_per_sqm": round(totals["min_price_per_sqm"], 0),
+                "max_price_per_sqm": round(totals["max_price_per_sqm"], 0),
+                "total_volume": totals["price_sum"],
+            }
 
-        # Keep only top 5 property types by deal count
-        property_type_analysis = dict(
-            sorted(property_type_analysis.items(), key=lambda x: x[1]["deal_count"], reverse=True)[
-                :5
-            ]
+        # Streamlined property type analysis (top 5 by deal count, averages for those only)
+        property_type_counts = Counter(
+            {
+                prop_type: len(prices_per_sqm)
+                for prop_type, prices_per_sqm in property_types.items()
+                if len(prices_per_sqm) >= 2  # Only include types with multiple deals
+            }
         )
+        property_type_analysis = {
+            prop_type: {
+                "deal_count": count,
+                "avg_price_per_sqm": round(sum(property_types[prop_type]) / count, 0),
+            }
+            for prop_type, count in property_type_counts.most_common(5)
+        }
 
-        # Streamlined neighborhood analysis (top 5 only)
-        neighborhood_analysis = {}
-        for neighborhood, prices_per_sqm in neighborhoods.items():
-            if len(prices_per_sqm) >= 3:  # Minimum 3 deals for statistical significance
-                neighborhood_analysis[neighborhood] = {
-                    "deal_count": len(prices_per_sqm),
-                    "avg_price_per_sqm": round(sum(prices_per_sqm) / len(prices_per_sqm), 0),
-                }
-
-        # Keep only top 5 neighborhoods by deal count
-        neighborhood_analysis = dict(
-            sorted(neighborhood_analysis.items(), key=lambda x: x[1]["deal_count"], reverse=True)[
-                :5
-            ]
+        # Streamlined neighborhood analysis (top 5 by deal count, averages for those only)
+        neighborhood_counts = Counter(
+            {
+                neighborhood: len(prices_per_sqm)
+                for neighborhood, prices_per_sqm in neighborhoods.items()
+                if len(prices_per_sqm) >= 3  # Minimum 3 deals for statistical significance
+            }
         )
+        neighborhood_analysis = {
+            neighborhood: {
+                "deal_count": count,
+                "avg_price_per_sqm": round(sum(neighborhoods[neighborhood]) / count, 0),
+            }
+            for neighborhood, count in neighborhood_counts.most_common(5)
+        }
 
         # Simple trend analysis
         years_sorted = sorted(yearly_trends.keys())
@@ -663,7 +689,7 @@ def analyze_market_trends(
                     "last_year_avg_price_per_sqm": last_year["avg_price_per_sqm"],
                 }
 
-        deal_type_desc = "first hand (new)" if deal_type == 1 else "second hand (used)"
+        deal_type_desc = _deal_type_description(deal_type)
 
         # Return summarized analysis (NO raw deals to save tokens)
         # Normalize structure with standard market_statistics while keeping tool-specific analysis
@@ -678,7 +704,7 @@ def analyze_market_trends(
         if search_coords:
             analysis_params["search_coordinates"] = search_coords
 
-        return json.dumps(
+        return dumps(
             {
                 "analysis_parameters": analysis_params,
                 "market_statistics": {
@@ -709,16 +735,106 @@ def analyze_market_trends(
                     "deal_source_summary": f"Building: {len([d for d in deals if getattr(d, 'deal_source', None) == 'same_building'])}, Street: {len([d for d in deals if getattr(d, 'deal_source', None) == 'street'])}, Neighborhood: {len([d for d in deals if getattr(d, 'deal_source', None) == 'neighborhood'])}",
                 },
                 "deals": [],  # Trend analysis doesn't return raw deals to save tokens
-            },
-            ensure_ascii=False,
-            indent=None,
+            }
         )
 
     except Exception as e:
-        logger.error(f"Error in analyze_market_trends: {e}", exc_info=True)
+        logger.error("Error in analyze_market_trends: %s", e, exc_info=True)
         return f"Error analyzing market trends: {str(e)}"
 
 
+def _compare_address(address: str) -> Dict[str, Any]:
+    """Build the compare_addresses summary for a single address."""
+    try:
+        # Get coordinates for this address
+        search_coords = None
+        try:
+            autocomplete_result = client.autocomplete_address(address)
+            if autocomplete_result.results:
+                coords = autocomplete_result.results[0].coordinates
+                if coords:
+                    search_coords = {
+                        "longitude": coords.longitude,
+                        "latitude": coords.latitude,
+                    }
+        except Exception:
+            pass  # Continue without coordinates if autocomplete fails
+
+        deals = client.find_recent_deals_for_address(address, 2)
+
+        if deals:
+            prices = [deal.deal_amount for deal in deals if deal.deal_amount]
+            areas = [deal.asset_area for deal in deals if deal.asset_area]
+            price_per_sqm_values = [deal.price_per_sqm for deal in deals if deal.price_per_sqm]
+            building_deals = [
+                deal for deal in deals if getattr(deal, "deal_source", None) == "same_building"
+            ]
+            street_deals = [
+                deal for deal in deals if getattr(deal, "deal_source", None) == "street"
+            ]
+            neighborhood_deals = [
+                deal for deal in deals if getattr(deal, "deal_source", None) == "neighborhood"
+            ]
+
+            comparison = {
+                "address": address,
+                "search_coordinates": search_coords,
+                "total_deals": len(deals),
+                "same_building_deals": len(building_deals),
+                "street_deals": len(street_deals),
+                "neighborhood_deals": len(neighborhood_deals),
+                "same_building_percentage": round((len(building_deals) / len(deals)) * 100, 1)
+                if deals
+                else 0,
+                "street_emphasis_percentage": round((len(street_deals) / len(deals)) * 100, 1)
+                if deals
+                else 0,
+                "price_stats": {
+                    "average_price": round(sum(prices) / len(prices), 0) if prices else 0,
+                    "min_price": min(prices) if prices else 0,
+                    "max_price": max(prices) if prices else 0,
+                },
+                "area_stats": {
+                    "average_area": round(sum(areas) / len(areas), 1) if areas else 0,
+                    "min_area": min(areas) if areas else 0,
+                    "max_area": max(areas) if areas else 0,
+                },
+                "price_per_sqm_stats": {
+                    "average_price_per_sqm": round(
+                        sum(price_per_sqm_values) / len(price_per_sqm_values), 0
+                    )
+                    if price_per_sqm_values
+                    else 0,
+                    "min_price_per_sqm": round(min(price_per_sqm_values), 0)
+                    if price_per_sqm_values
+                    else 0,
+                    "max_price_per_sqm": round(max(price_per_sqm_values), 0)
+                    if price_per_sqm_values
+                    else 0,
+                },
+            }
+        else:
+            comparison = {
+                "address": address,
+                "search_coordinates": search_coords,
+                "total_deals": 0,
+                "same_building_deals": 0,
+                "street_deals": 0,
+                "neighborhood_deals": 0,
+                "same_building_percentage": 0,
+                "street_emphasis_percentage": 0,
+                "price_stats": {},
+                "area_stats": {},
+                "price_per_sqm_stats": {},
+            }
+
+        return comparison
+
+    except Exception as e:
+        logger.error("Error comparing %s: %s", address, e)
+        return {"address": address, "error": str(e)}
+
+
 @conditional_tool("tool_compare_addresses_enabled")
 def compare_addresses(addresses: List[str]) -> str:
     """Compare real estate markets between multiple addresses.
@@ -733,140 +849,32 @@ def compare_addresses(addresses: List[str]) -> str:
     """
     log_mcp_call("compare_addresses", addresses=addresses)
     try:
-        comparisons = []
-
-        for address in addresses:
-            try:
-                # Get coordinates for this address
-                search_coords = None
-                try:
-                    autocomplete_result = client.autocomplete_address(address)
-                    if autocomplete_result.results:
-                        coords = autocomplete_result.results[0].coordinates
-                        if coords:
-                            search_coords = {
-                                "longitude": coords.longitude,
-                                "latitude": coords.latitude,
-                            }
-                except Exception:
-                    pass  # Continue without coordinates if autocomplete fails
-
-                deals = client.find_recent_deals_for_address(address, 2)
-
-                if deals:
-                    prices = [deal.deal_amount for deal in deals if deal.deal_amount]
-                    areas = [deal.asset_area for deal in deals if deal.asset_area]
-                    price_per_sqm_values = [
-                        deal.price_per_sqm for deal in deals if deal.price_per_sqm
-                    ]
-                    building_deals = [
-                        deal
-                        for deal in deals
-                        if getattr(deal, "deal_source", None) == "same_building"
-                    ]
-                    street_deals = [
-                        deal for deal in deals if getattr(deal, "deal_source", None) == "street"
-                    ]
-                    neighborhood_deals = [
-                        deal
-                        for deal in deals
-                        if getattr(deal, "deal_source", None) == "neighborhood"
-                    ]
-
-                    comparison = {
-                        "address": address,
-                        "search_coordinates": search_coords,
-                        "total_deals": len(deals),
-                        "same_building_deals": len(building_deals),
-                        "street_deals": len(street_deals),
-                        "neighborhood_deals": len(neighborhood_deals),
-                        "same_building_percentage": round(
-                            (len(building_deals) / len(deals)) * 100, 1
-                        )
-                        if deals
-                        else 0,
-                        "street_emphasis_percentage": round(
-                            (len(street_deals) / len(deals)) * 100, 1
-                        )
-                        if deals
-                        else 0,
-                        "price_stats": {
-                            "average_price": round(sum(prices) / len(prices), 0) if prices else 0,
-                            "min_price": min(prices) if prices else 0,
-                            "max_price": max(prices) if prices else 0,
-                        },
-                        "area_stats": {
-                            "average_area": round(sum(areas) / len(areas), 1) if areas else 0,
-                            "min_area": min(areas) if areas else 0,
-                            "max_area": max(areas) if areas else 0,
-                        },
-                        "price_per_sqm_stats": {
-                            "average_price_per_sqm": round(
-                                sum(price_per_sqm_values) / len(price_per_sqm_values), 0
-                            )
-                            if price_per_sqm_values
-                            else 0,
-                            "min_price_per_sqm": round(min(price_per_sqm_values), 0)
-                            if price_per_sqm_values
-                            else 0,
-                            "max_price_per_sqm": round(max(price_per_sqm_values), 0)
-                            if price_per_sqm_values
-                            else 0,
-                        },
-                    }
-                else:
-                    comparison = {
-                        "address": address,
-                        "search_coordinates": search_coords,
-                        "total_deals": 0,
-                        "same_building_deals": 0,
-                        "street_deals": 0,
-                        "neighborhood_deals": 0,
-                        "same_building_percentage": 0,
-                        "street_emphasis_percentage": 0,
-                        "price_stats": {},
-                        "area_stats": {},
-                        "price_per_sqm_stats": {},
-                    }
-
-                comparisons.append(comparison)
-
-            except Exception as e:
-                logger.error(f"Error comparing {address}: {e}")
-                comparisons.append({"address": address, "error": str(e)})
-
-        # Rank addresses by average price per sqm
-        valid_comparisons = []
+        # Each address is an independent chain of API calls, so run them side by side.
+        # The client's rate limiter is thread-safe and still caps the overall request rate.
+        max_workers = min(len(addresses), _COMPARE_MAX_WORKERS) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            comparisons = list(executor.map(_compare_address, addresses))
+
+        # Rank addresses by average price per sqm (decorate once, sort on the key)
+        ranked = []
         for comparison in comparisons:
-            if (
-                isinstance(comparison, dict)
-                and "price_per_sqm_stats" in comparison
-                and isinstance(comparison["price_per_sqm_stats"], dict)
-                and comparison["price_per_sqm_stats"].get("average_price_per_sqm", 0) > 0
-            ):
-                valid_comparisons.append(comparison)
-
-        # Sort by price per sqm
-        def get_price_per_sqm(comp: dict) -> float:
-            price_stats = comp.get("price_per_sqm_stats", {})
-            if isinstance(price_stats, dict):
-                return price_stats.get("average_price_per_sqm", 0)
-            return 0
+            price_stats = comparison.get("price_per_sqm_stats")
+            if isinstance(price_stats, dict) and price_stats.get("average_price_per_sqm", 0) > 0:
+                ranked.append((price_stats["average_price_per_sqm"], comparison))
 
-        valid_comparisons.sort(key=get_price_per_sqm, reverse=True)
+        ranked.sort(key=itemgetter(0), reverse=True)
+        valid_comparisons = [comparison for _, comparison in ranked]
 
-        return json.dumps(
+        return dumps(
             {
                 "addresses_compared": len(addresses),
                 "ranking_by_average_price_per_sqm": valid_comparisons,
                 "all_results": comparisons,
-            },
-            ensure_ascii=False,
-            indent=None,
+            }
         )
 
     except Exception as e:
-        logger.error(f"Error in compare_addresses: {e}", exc_info=True)
+        logger.error("Error in compare_addresses: %s", e, exc_info=True)
         return f"Error comparing addresses: {str(e)}"
 
 
@@ -967,7 +975,7 @@ def get_valuation_comparables(
             search_params_base["search_coordinates"] = search_coords
 
         if not deals:
-            return json.dumps(
+            return dumps(
                 {
                     "search_parameters": search_params_base,
                     "market_statistics": {
@@ -977,13 +985,11 @@ def get_valuation_comparables(
                     },
                     "deals": [],
                     "message": "No deals found for this address",
-                },
-                ensure_ascii=False,
-                indent=None,
+                }
             )
 
         # Apply filters
-        logger.info(f"Applying criteria filters to {len(deals)} deals")
+        logger.info("Applying criteria filters to %d deals", len(deals))
         filtered_deals = client.filter_deals_by_criteria(
             deals,
             property_type=property_type,
@@ -997,8 +1003,9 @@ def get_valuation_comparables(
             max_floor=max_floor,
         )
         logger.info(
-            f"After criteria filtering: {len(filtered_deals)} deals "
-            f"(removed {len(deals) - len(filtered_deals)} deals)"
+            "After criteria filtering: %d deals (removed %d deals)",
+            len(filtered_deals),
+            len(deals) - len(filtered_deals),
         )
 
         # Apply outlier filtering to remove statistical outliers
@@ -1020,13 +1027,17 @@ def get_valuation_comparables(
                 iqr_multiplier if iqr_multiplier is not None else config.analysis_iqr_multiplier
             )
             logger.info(
-                f"After outlier filtering ({config.analysis_outlier_method}, k={effective_k}): "
-                f"{len(filtered_deals)} deals (removed {deals_before_outlier_filter - len(filtered_deals)} outliers)"
+                "After outlier filtering (%s, k=%s): %d deals (removed %d outliers)",
+                config.analysis_outlier_method,
+                effective_k,
+                len(filtered_deals),
+                deals_before_outlier_filter - len(filtered_deals),
             )
         else:
             logger.info(
-                f"Skipping outlier filtering: only {len(filtered_deals)} deals "
-                f"(minimum {config.analysis_min_deals_for_outlier_detection} required)"
+                "Skipping outlier filtering: only %d deals (minimum %d required)",
+                len(filtered_deals),
+                config.analysis_min_deals_for_outlier_detection,
             )
 
         # Calculate statistics on filtered comparables
@@ -1073,10 +1084,10 @@ def get_valuation_comparables(
                 outlier_report["outlier_deals"], lang=lang
             )
 
-        return json.dumps(response_data, ensure_ascii=False, indent=None)
+        return dumps(response_data)
 
     except Exception as e:
-        logger.error(f"Error in get_valuation_comparables: {e}", exc_info=True)
+        logger.error("Error in get_valuation_comparables: %s", e, exc_info=True)
         return f"Error getting valuation comparables: {str(e)}"
 
 
@@ -1134,7 +1145,7 @@ def get_deal_statistics(
             search_params_base["search_coordinates"] = search_coords
 
         if not deals:
-            return json.dumps(
+            return dumps(
                 {
                     "search_parameters": search_params_base,
                     "market_statistics": {
@@ -1142,9 +1153,7 @@ def get_deal_statistics(
                         "message": "No deals found for this address",
                     },
                     "deals": [],
-                },
-                ensure_ascii=False,
-                indent=None,
+                }
             )
 
         # Apply filters if provided
@@ -1178,10 +1187,10 @@ def get_deal_statistics(
             },
         }
 
-        return json.dumps(response_data, ensure_ascii=False, indent=None)
+        return dumps(response_data)
 
     except Exception as e:
-        logger.error(f"Error in get_deal_statistics: {e}", exc_info=True)
+        logger.error("Error in get_deal_statistics: %s", e, exc_info=True)
         return f"Error calculating deal statistics: {str(e)}"
 
 
@@ -1207,7 +1216,7 @@ def _safe_calculate_metric(metric_func, deals):
             return result.model_dump(exclude_none=True)
         return result
     except Exception as e:
-        logger.warning(f"Error calculating metric {metric_func.__name__}: {e}")
+        logger.warning("Error calculating metric %s: %s", metric_func.__name__, e)
         return {"error": str(e)}
 
 
@@ -1258,7 +1267,7 @@ def get_market_activity_metrics(address: str, years_back: int = 2, radius_meters
             analysis_params_base["search_coordinates"] = search_coords
 
         if not deals:
-            return json.dumps(
+            return dumps(
                 {
                     "analysis_parameters": analysis_params_base,
                     "market_statistics": {
@@ -1268,9 +1277,7 @@ def get_market_activity_metrics(address: str, years_back: int = 2, radius_meters
                     },
                     "deals": [],
                     "error": "No deals found for analysis",
-                },
-                ensure_ascii=False,
-                indent=None,
+                }
             )
 
         # Calculate market metrics using helper to reduce duplication
@@ -1279,7 +1286,7 @@ def get_market_activity_metrics(address: str, years_back: int = 2, radius_meters
         investment_metrics = _safe_calculate_metric(client.analyze_investment_potential, deals)
 
         # Combine all metrics with normalized structure
-        return json.dumps(
+        return dumps(
             {
                 "analysis_parameters": analysis_params_base,
                 "market_statistics": {
@@ -1300,13 +1307,11 @@ def get_market_activity_metrics(address: str, years_back: int = 2, radius_meters
                     "market_stability": investment_metrics.get("market_stability"),
                 },
                 "deals": [],  # Activity metrics don't return raw deals
-            },
-            ensure_ascii=False,
-            indent=None,
+            }
         )
 
     except Exception as e:
-        logger.error(f"Error in get_market_activity_metrics: {e}", exc_info=True)
+        logger.error("Error in get_market_activity_metrics: %s", e, exc_info=True)
         return f"Error analyzing market activity: {str(e)}"
 
 
@@ -8,12 +8,14 @@ and real estate information.
 
 from datetime import datetime, timedelta
 import logging
+import threading
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
 from nadlan_mcp.config import GovmapConfig, get_config
+from nadlan_mcp.json_utils import loads as json_loads
 
 # Import functions from modular package
 from . import filters, market_analysis, statistics, utils, validators
@@ -60,18 +62,35 @@ class GovmapClient:
             {"Content-Type": "application/json", "User-Agent": self.config.user_agent}
         )
         self.last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
 
     def _rate_limit(self):
         """
         Enforce rate limiting by sleeping if necessary.
 
-        Ensures requests don't exceed the configured requests_per_second.
+        Ensures requests don't exceed the configured requests_per_second, also when
+        several threads share the client. Each caller reserves the next free slot
+        under the lock and sleeps outside it.
         """
         min_interval = 1.0 / self.config.requests_per_second
-        elapsed = time.time() - self.last_request_time
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self.last_request_time = time.time()
+        with self._rate_limit_lock:
+            now = time.time()
+            slot = max(now, self.last_request_time + min_interval)
+            self.last_request_time = slot
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _parse_json(self, response: requests.Response) -> Any:
+        """
+        Decode a response body straight from bytes.
+
+        Decode errors are re-raised as requests' JSONDecodeError so the retry
+        loops treat them exactly like ``response.json()`` failures.
+        """
+        try:
+            return json_loads(response.content)
+        except ValueError as e:
+            raise requests.exceptions.JSONDecodeError(str(e), response.text, 0) from e
 
     # Validation methods (delegate to validators module)
     def _validate_address(self, address: str) -> str:
@@ -138,7 +157,7 @@ class GovmapClient:
                 response = self.session.post(url, json=payload, timeout=timeout)
                 response.raise_for_status()
 
-                data = response.json()
+                data = self._parse_json(response)
                 if not data or "results" not in data:
                     raise ValueError("Invalid response format from autocomplete API")
 
@@ -225,7 +244,7 @@ class GovmapClient:
                 response = self.session.post(url, json=payload, timeout=timeout)
                 response.raise_for_status()
 
-                data = response.json()
+                data = self._parse_json(response)
                 return data
 
             except (requests.RequestException, requests.Timeout) as e:
@@ -285,7 +304,7 @@ class GovmapClient:
                 response = self.session.get(url, timeout=timeout)
                 response.raise_for_status()
 
-                data = response.json()
+                data = self._parse_json(response)
                 if not isinstance(data, list):
                     raise ValueError(f"Expected list response, got {type(data).__name__}")
 
@@ -372,7 +391,7 @@ class GovmapClient:
                 response = self.session.get(url, params=params, timeout=timeout)
                 response.raise_for_status()
 
-                data = response.json()
+                data = self._parse_json(response)
                 # API returns {data: [...], totalCount: ..., limit: ..., offset: ...}
                 deal_dicts = []
                 if isinstance(data, dict) and "data" in data:
@@ -470,7 +489,7 @@ class GovmapClient:
                 response = self.session.get(url, params=params, timeout=timeout)
                 response.raise_for_status()
 
-                data = response.json()
+                data = self._parse_json(response)
                 # API returns {data: [...], totalCount: ..., limit: ..., offset: ...}
                 deal_dicts = []
                 if isinstance(data, dict) and "data" in data:
@@ -672,6 +691,13 @@ class GovmapClient:
             neighborhood_deals = []
             seen_deals = set()  # For deduplication
 
+            # Bind per-polygon calls and per-deal limits once, outside the loops
+            get_street_deals = self.get_street_deals
+            get_neighborhood_deals = self.get_neighborhood_deals
+            is_same_building = self._is_same_building
+            max_street_distance = self.config.max_street_deal_distance_meters
+            max_neighborhood_distance = self.config.max_neighborhood_deal_distance_meters
+
             for polygon_meta in polygon_metadata_list:
                 polygon_id = polygon_meta["polygon_id"]
                 polygon_distance = polygon_meta["distance"]
@@ -693,7 +719,7 @@ class GovmapClient:
 
                 try:
                     # Get street deals first (higher priority)
-                    current_street_deals = self.get_street_deals(
+                    current_street_deals = get_street_deals(
                         polygon_id,
                         limit=max(1, max_deals // 2),  # Allocate more to street deals (min 1)
                         start_date=start_date_str,
@@ -705,7 +731,7 @@ class GovmapClient:
                     current_neighborhood_deals = []
                     # Skip neighborhood deals if we have enough street deals
                     if len(street_deals) < max_deals // 2:
-                        current_neighborhood_deals = self.get_neighborhood_deals(
+                        current_neighborhood_deals = get_neighborhood_deals(
                             polygon_id,
                             limit=max(
                                 1, max_deals // 4
@@ -748,19 +774,19 @@ class GovmapClient:
                                 getattr(deal, "houseNum", None) or deal.house_number or ""
                             )
                             deal_address = f"{street} {house_num}".lower().strip()
-                            if self._is_same_building(search_address_normalized, deal_address):
+                            if is_same_building(search_address_normalized, deal_address):
                                 deal.deal_source = "same_building"
                                 deal.priority = 0  # Highest priority
                                 building_deals.append(deal)
                             else:
                                 # Apply distance filter for street deals (not same building)
-                                if deal_distance <= self.config.max_street_deal_distance_meters:
+                                if deal_distance <= max_street_distance:
                                     deal.priority = 1  # Street deals priority
                                     street_deals.append(deal)
                                 else:
                                     logger.debug(
                                         f"Filtered street deal at {deal_distance:.0f}m "
-                                        f"(max: {self.config.max_street_deal_distance_meters}m)"
+                                        f"(max: {max_street_distance}m)"
                                     )
 
                     # Add neighborhood deals with lowest priority
@@ -779,7 +805,7 @@ class GovmapClient:
                                 deal_distance = polygon_distance
 
                             # Apply distance filter for neighborhood deals
-                            if deal_distance <= self.config.max_neighborhood_deal_distance_meters:
+                            if deal_distance <= max_neighborhood_distance:
                                 # Store metadata using dynamic attributes
                                 deal.source_polygon_id = polygon_id
                                 deal.deal_source = "neighborhood"
@@ -789,7 +815,7 @@ class GovmapClient:
                             else:
                                 logger.debug(
                                     f"Filtered neighborhood deal at {deal_distance:.0f}m "
-                                    f"(max: {self.config.max_neighborhood_deal_distance_meters}m)"
+                                    f"(max: {max_neighborhood_distance}m)"
                                 )
 
                 except Exception as e:
@@ -4,12 +4,37 @@ Deal filtering functions.
 This module provides composable functions for filtering real estate deal data.
 """
 
-from typing import List, Optional, Union
+from functools import lru_cache
+import math
+from typing import Dict, List, Optional, Tuple, Union
 
 from .models import Deal, DealFilters
 from .utils import extract_floor_number
 
 
+def _range_bounds(low: Optional[float], high: Optional[float]) -> Tuple[float, float]:
+    """Return (low, high) with missing ends replaced by -inf/+inf."""
+    return (
+        -math.inf if low is None else low,
+        math.inf if high is None else high,
+    )
+
+
+@lru_cache(maxsize=128)
+def _property_type_terms(property_type: str) -> Tuple[str, Optional[str]]:
+    """
+    Normalize a property type filter term for flexible matching.
+
+    Returns the normalized term and, for terms ending in ה, the ת variant.
+    Hebrew feminine endings change in construct form, so this allows "דירה"
+    to match "דירת גג", "דירה בבניין", etc. Tools filter on the same few
+    terms, so results are cached.
+    """
+    normalized = property_type.lower().strip()
+    variant = normalized[:-1] + "ת" if normalized.endswith("ה") else None
+    return normalized, variant
+
+
 def filter_deals_by_criteria(
     deals: List[Deal],
     filters: Optional[Union[DealFilters, dict]] = None,
@@ -77,79 +102,89 @@ def filter_deals_by_criteria(
     if min_floor is not None and max_floor is not None and min_floor > max_floor:
         raise ValueError("min_floor cannot be greater than max_floor")
 
+    # Resolve everything that only depends on the filter values once, so the
+    # per-deal loop below does attribute reads and comparisons only
+    filter_property_type = property_type is not None
+    filter_rooms = min_rooms is not None or max_rooms is not None
+    filter_price = min_price is not None or max_price is not None
+    filter_area = min_area is not None or max_area is not None
+    filter_floor = min_floor is not None or max_floor is not None
+
+    # Nothing to filter on: skip the per-deal loop, but still hand back a new list
+    # so callers can modify the result without touching the input
+    if not (filter_property_type or filter_rooms or filter_price or filter_area or filter_floor):
+        return list(deals)
+
+    # Open ends of a range become infinities, so each range is one low/high check per
+    # deal with no per-bound None tests. Kept as separate < and > comparisons (not a
+    # chained low <= v <= high) so NaN values pass exactly as before
+    rooms_low, rooms_high = _range_bounds(min_rooms, max_rooms)
+    price_low, price_high = _range_bounds(min_price, max_price)
+    area_low, area_high = _range_bounds(min_area, max_area)
+    floor_low, floor_high = _range_bounds(min_floor, max_floor)
+
+    if filter_property_type:
+        property_type_normalized, property_type_variant = _property_type_terms(property_type)
+
+        # A deal list only carries a handful of distinct property type descriptions,
+        # so match each description once and look the answer up for the rest
+        property_type_matches: Dict[str, bool] = {}
+
     filtered_deals = []
 
+    # Checks run cheapest first: plain numeric comparisons, then the property type
+    # lookup, then the floor check, which may have to parse a description
     for deal in deals:
-        # Property type filter
-        if property_type is not None:
-            deal_type = deal.property_type_description
-            # Skip deals with missing property type data when filter is active
-            if not deal_type:
-                continue
-
-            # Normalize both strings for flexible matching
-            property_type_normalized = property_type.lower().strip()
-            deal_type_normalized = deal_type.lower().strip()
-
-            # Handle Hebrew feminine ending variations (ה ↔ ת)
-            # If the filter term ends with ה, also check for the ת variant
-            # This allows "דירה" to match "דירת גג", "דירה בבניין", etc.
-            if property_type_normalized.endswith("ה"):
-                property_type_variant = property_type_normalized[:-1] + "ת"
-                if (
-                    property_type_variant not in deal_type_normalized
-                    and property_type_normalized not in deal_type_normalized
-                ):
-                    # No match found for either variant
-                    continue
-            else:
-                # For non-ה endings, do substring match
-                if property_type_normalized not in deal_type_normalized:
-                    continue
-
         # Room count filter
-        if min_rooms is not None or max_rooms is not None:
+        if filter_rooms:
             rooms = deal.rooms
-            if rooms is None:
-                continue  # Skip deals with missing room data when filter is active
-            if min_rooms is not None and rooms < min_rooms:
-                continue
-            if max_rooms is not None and rooms > max_rooms:
+            # Deals with missing room data are skipped when the filter is active
+            if rooms is None or rooms < rooms_low or rooms > rooms_high:
                 continue
 
         # Price filter
-        if min_price is not None or max_price is not None:
+        if filter_price:
             price = deal.deal_amount
-            if price is None:
-                continue  # Skip deals with missing price data when filter is active
-            if min_price is not None and price < min_price:
-                continue
-            if max_price is not None and price > max_price:
+            # Deals with missing price data are skipped when the filter is active
+            if price is None or price < price_low or price > price_high:
                 continue
 
         # Area filter
-        if min_area is not None or max_area is not None:
+        if filter_area:
             area = deal.asset_area
-            if area is None:
-                continue  # Skip deals with missing area data when filter is active
-            if min_area is not None and area < min_area:
+            # Deals with missing area data are skipped when the filter is active
+            if area is None or area < area_low or area > area_high:
+                continue
+
+        # Property type filter
+        if filter_property_type:
+            deal_type = deal.property_type_description
+            # Skip deals with missing property type data when filter is active
+            if not deal_type:
                 continue
-            if max_area is not None and area > max_area:
+
+            matched = property_type_matches.get(deal_type)
+            if matched is None:
+                deal_type_normalized = deal_type.lower().strip()
+                matched = property_type_normalized in deal_type_normalized or (
+                    property_type_variant is not None
+                    and property_type_variant in deal_type_normalized
+                )
+                property_type_matches[deal_type] = matched
+            if not matched:
+                # No match found for either variant
                 continue
 
         # Floor filter
-        if min_floor is not None or max_floor is not None:
+        if filter_floor:
             # Use floor_number if available, otherwise try to parse floor description
             floor_num = deal.floor_number
             if floor_num is None and deal.floor:
                 # Try to extract floor number (handles Hebrew floor descriptions)
                 floor_num = extract_floor_number(deal.floor)
 
-            if floor_num is not None:
-                if min_floor is not None and floor_num < min_floor:
-                    continue
-                if max_floor is not None and floor_num > max_floor:
-                    continue
+            if floor_num is not None and (floor_num < floor_low or floor_num > floor_high):
+                continue
 
         filtered_deals.append(deal)
 
@@ -5,6 +5,8 @@ This module provides functions to detect and filter outliers from deal data,
 improving the accuracy of statistical analyses and market assessments.
 """
 
+from itertools import compress
+from operator import not_
 from typing import Any, Dict, List, Optional, Tuple
 
 from nadlan_mcp.config import GovmapConfig, get_config
@@ -126,25 +128,43 @@ def apply_hard_bounds_price_per_sqm(
     if config is None:
         config = get_config()
 
-    filters = []
-    for deal in deals:
-        price_per_sqm = deal.price_per_sqm
+    return _price_per_sqm_outliers([deal.price_per_sqm for deal in deals], config)
+
+
+def _price_per_sqm_outliers(
+    prices_per_sqm: List[Optional[float]], config: GovmapConfig
+) -> List[bool]:
+    """Hard-bounds mask over already computed price per sqm values (None is never an outlier)."""
+    min_price_per_sqm = config.analysis_price_per_sqm_min
+    max_price_per_sqm = config.analysis_price_per_sqm_max
 
+    filters = []
+    for price_per_sqm in prices_per_sqm:
         # Skip deals without valid price per sqm
         if price_per_sqm is None:
             filters.append(False)
             continue
 
         # Check bounds
-        is_outlier = (
-            price_per_sqm < config.analysis_price_per_sqm_min
-            or price_per_sqm > config.analysis_price_per_sqm_max
-        )
+        is_outlier = price_per_sqm < min_price_per_sqm or price_per_sqm > max_price_per_sqm
         filters.append(is_outlier)
 
     return filters
 
 
+def _remaining_metric_values(
+    metric_values: List[Optional[float]], filters_to_remove: List[bool]
+) -> Tuple[List[float], List[int]]:
+    """Metric values of the deals not yet filtered out, with their indices into the deal list."""
+    values = []
+    value_indices = []
+    for i, value in enumerate(metric_values):
+        if value is not None and not filters_to_remove[i]:
+            values.append(value)
+            value_indices.append(i)
+    return values, value_indices
+
+
 def apply_hard_bounds_deal_amount(
     deals: List[Deal], config: Optional[GovmapConfig] = None
 ) -> List[bool]:
@@ -164,12 +184,8 @@ def apply_hard_bounds_deal_amount(
     if config is None:
         config = get_config()
 
-    filters = []
-    for deal in deals:
-        is_outlier = deal.deal_amount < config.analysis_min_deal_amount
-        filters.append(is_outlier)
-
-    return filters
+    min_deal_amount = config.analysis_min_deal_amount
+    return [deal.deal_amount < min_deal_amount for deal in deals]
 
 
 def filter_deals_for_analysis(
@@ -230,20 +246,24 @@ def filter_deals_for_analysis(
             "parameters": {"reason": "disabled or insufficient data"},
         }
 
-    # Initialize filter masks (True = keep, False = remove)
-    filters_to_remove = [False] * len(deals)
-
-    # Step 1: Apply hard bounds to price per sqm
-    price_per_sqm_outliers = apply_hard_bounds_price_per_sqm(deals, config)
-    for i, is_outlier in enumerate(price_per_sqm_outliers):
-        if is_outlier:
-            filters_to_remove[i] = True
-
-    # Step 2: Apply hard bounds to deal amount
-    deal_amount_outliers = apply_hard_bounds_deal_amount(deals, config)
-    for i, is_outlier in enumerate(deal_amount_outliers):
-        if is_outlier:
-            filters_to_remove[i] = True
+    # price_per_sqm is a computed field, re-evaluated on every access: read each deal's once
+    prices_per_sqm = [deal.price_per_sqm for deal in deals]
+    if metric == "price_per_sqm":
+        metric_values = prices_per_sqm
+    elif metric == "deal_amount":
+        metric_values = [deal.deal_amount for deal in deals]
+    else:
+        metric_values = []
+
+    # Steps 1 and 2: Apply hard bounds to price per sqm and deal amount, merged into the
+    # initial filter mask in one pass (True = remove)
+    filters_to_remove = [
+        price_per_sqm_outlier or deal_amount_outlier
+        for price_per_sqm_outlier, deal_amount_outlier in zip(
+            _price_per_sqm_outliers(prices_per_sqm, config),
+            apply_hard_bounds_deal_amount(deals, config),
+        )
+    ]
 
     # Step 3: Apply statistical outlier detection to specified metric
     # Use override value if provided, otherwise use config
@@ -252,24 +272,8 @@ def filter_deals_for_analysis(
     )
 
     if config.analysis_outlier_method == "iqr":
-        # Extract values for the specified metric
-        if metric == "price_per_sqm":
-            values = [
-                deal.price_per_sqm
-                for i, deal in enumerate(deals)
-                if deal.price_per_sqm is not None and not filters_to_remove[i]
-            ]
-            value_indices = [
-                i
-                for i, deal in enumerate(deals)
-                if deal.price_per_sqm is not None and not filters_to_remove[i]
-            ]
-        elif metric == "deal_amount":
-            values = [deal.deal_amount for i, deal in enumerate(deals) if not filters_to_remove[i]]
-            value_indices = [i for i in range(len(deals)) if not filters_to_remove[i]]
-        else:
-            values = []
-            value_indices = []
+        # Extract values for the specified metric from deals not filtered out yet
+        values, value_indices = _remaining_metric_values(metric_values, filters_to_remove)
 
         if values:
             statistical_outliers = detect_outliers_iqr(values, effective_iqr_multiplier)
@@ -278,24 +282,8 @@ def filter_deals_for_analysis(
                     filters_to_remove[value_indices[i]] = True
 
     elif config.analysis_outlier_method == "percent":
-        # Extract values for the specified metric
-        if metric == "price_per_sqm":
-            values = [
-                deal.price_per_sqm
-                for i, deal in enumerate(deals)
-                if deal.price_per_sqm is not None and not filters_to_remove[i]
-            ]
-            value_indices = [
-                i
-                for i, deal in enumerate(deals)
-                if deal.price_per_sqm is not None and not filters_to_remove[i]
-            ]
-        elif metric == "deal_amount":
-            values = [deal.deal_amount for i, deal in enumerate(deals) if not filters_to_remove[i]]
-            value_indices = [i for i in range(len(deals)) if not filters_to_remove[i]]
-        else:
-            values = []
-            value_indices = []
+        # Extract values for the specified metric from deals not filtered out yet
+        values, value_indices = _remaining_metric_values(metric_values, filters_to_remove)
 
         if values:
             statistical_outliers = detect_outliers_percent(values, 0.5)
@@ -306,24 +294,8 @@ def filter_deals_for_analysis(
     # Step 4: Apply percentage-based backup filtering (catches extreme outliers in heterogeneous data)
     # This runs in addition to IQR when enabled, providing a safety net for wide distributions
     if config.analysis_use_percentage_backup and config.analysis_outlier_method == "iqr":
-        # Extract values for the specified metric (same logic as above)
-        if metric == "price_per_sqm":
-            values = [
-                deal.price_per_sqm
-                for i, deal in enumerate(deals)
-                if deal.price_per_sqm is not None and not filters_to_remove[i]
-            ]
-            value_indices = [
-                i
-                for i, deal in enumerate(deals)
-                if deal.price_per_sqm is not None and not filters_to_remove[i]
-            ]
-        elif metric == "deal_amount":
-            values = [deal.deal_amount for i, deal in enumerate(deals) if not filters_to_remove[i]]
-            value_indices = [i for i in range(len(deals)) if not filters_to_remove[i]]
-        else:
-            values = []
-            value_indices = []
+        # Extract values for the specified metric from deals not filtered out yet
+        values, value_indices = _remaining_metric_values(metric_values, filters_to_remove)
 
         if values:
             percentage_outliers = detect_outliers_percent(
@@ -333,10 +305,10 @@ def filter_deals_for_analysis(
                 if is_outlier:
                     filters_to_remove[value_indices[i]] = True
 
-    # Filter deals
-    filtered_deals = [deal for i, deal in enumerate(deals) if not filters_to_remove[i]]
-    outlier_indices = [i for i, should_remove in enumerate(filters_to_remove) if should_remove]
-    outlier_deals = [deal for i, deal in enumerate(deals) if filters_to_remove[i]]
+    # Filter deals (compress selects by mask in C instead of indexing per deal)
+    filtered_deals = list(compress(deals, map(not_, filters_to_remove)))
+    outlier_indices = list(compress(range(len(deals)), filters_to_remove))
+    outlier_deals = list(compress(deals, filters_to_remove))
 
     # Create outlier report
     report = {
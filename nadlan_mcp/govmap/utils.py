@@ -5,9 +5,28 @@ This module provides shared helper functions with no external dependencies
 (except standard library).
 """
 
+from functools import lru_cache
 import re
 from typing import Optional, Tuple
 
+# Hebrew ordinal floor names to numbers
+HEBREW_FLOOR_NAMES = {
+    "קרקע": 0,
+    "מרתף": -1,
+    "ראשונה": 1,
+    "שניה": 2,
+    "שלישית": 3,
+    "רביעית": 4,
+    "חמישית": 5,
+    "שישית": 6,
+    "שביעית": 7,
+    "שמינית": 8,
+    "תשיעית": 9,
+    "עשירית": 10,
+}
+
+_FLOOR_NUMBER_RE = re.compile(r"\d+")
+
 
 def calculate_distance(point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
     """
@@ -127,10 +146,14 @@ def is_same_building(search_address: str, deal_address: str) -> bool:
     )
 
 
+@lru_cache(maxsize=256)
 def extract_floor_number(floor_str: str) -> int | None:
     """
     Extract numeric floor number from Hebrew floor description.
 
+    Deals repeat a small set of floor descriptions, so results are memoized and
+    each distinct string is parsed once.
+
     Args:
         floor_str: Floor description string (e.g., "שלישית", "קומה 3", "3")
 
@@ -140,34 +163,18 @@ def extract_floor_number(floor_str: str) -> int | None:
     if not floor_str:
         return None
 
-    # Hebrew ordinal floor names to numbers
-    hebrew_floors = {
-        "קרקע": 0,
-        "מרתף": -1,
-        "ראשונה": 1,
-        "שניה": 2,
-        "שלישית": 3,
-        "רביעית": 4,
-        "חמישית": 5,
-        "שישית": 6,
-        "שביעית": 7,
-        "שמינית": 8,
-        "תשיעית": 9,
-        "עשירית": 10,
-    }
-
     floor_lower = floor_str.lower().strip()
 
     # Check for direct match with Hebrew names
-    for heb, num in hebrew_floors.items():
+    for heb, num in HEBREW_FLOOR_NAMES.items():
         if heb in floor_lower:
             return num
 
     # Try to extract number from string
-    numbers = re.findall(r"\d+", floor_str)
-    if numbers:
+    match = _FLOOR_NUMBER_RE.search(floor_str)
+    if match:
         try:
-            return int(numbers[0])
+            return int(match.group())
         except ValueError:
             pass
 
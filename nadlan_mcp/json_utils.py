@@ -0,0 +1,51 @@
+"""
+JSON helpers for Nadlan MCP.
+
+Picks the fastest available backend once at import time: orjson, then ujson
+(both via pip install "nadlan-mcp[speedups]"), then the standard library.
+Callers use ``loads``/``dumps`` and pay no per-call dispatch cost.
+
+``dumps`` always returns a str with non-ASCII text (Hebrew) left unescaped and
+no indentation. Whitespace between tokens may differ between backends.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    # orjson decodes bytes directly, skipping the str round trip
+    loads = orjson.loads
+
+    # Option mask built once: allow int keys (e.g. years) and NumPy scalars/arrays
+    # without converting them to Python types first
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+    JSON_BACKEND = "orjson"
+except ImportError:
+    try:
+        import ujson
+
+        loads = ujson.loads
+
+        def dumps(obj: Any) -> str:
+            """Serialize obj to a compact JSON string."""
+            # ujson escapes "/" as "\\/" by default; match orjson and the stdlib output
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+        JSON_BACKEND = "ujson"
+    except ImportError:
+        loads = json.loads
+
+        def dumps(obj: Any) -> str:
+            """Serialize obj to a compact JSON string."""
+            return json.dumps(obj, ensure_ascii=False, indent=None)
+
+        JSON_BACKEND = "json"
+
+__all__ = ["JSON_BACKEND", "dumps", "loads"]
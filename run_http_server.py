@@ -28,6 +28,8 @@ def main():
     # Get port from environment variable (Render sets PORT automatically)
     port = int(os.environ.get("PORT", 8000))
     host = "0.0.0.0"
+    # Keep client connections open across tool calls (uvicorn's default is 5s)
+    keep_alive = int(os.environ.get("UVICORN_TIMEOUT_KEEP_ALIVE", 75))
 
     logger.info("=" * 60)
     logger.info("Starting Nadlan-MCP HTTP Server")
@@ -35,6 +37,7 @@ def main():
     logger.info("Transport: HTTP (via uvicorn)")
     logger.info(f"Host: {host}")
     logger.info(f"Port: {port}")
+    logger.info(f"Keep-Alive Timeout: {keep_alive}s")
     logger.info(f"MCP Endpoint: http://{host}:{port}/mcp")
     logger.info(f"Health Check: http://{host}:{port}/health")
     logger.info("=" * 60)
@@ -59,8 +62,18 @@ def main():
 
         logger.info(f"Using app: {type(app).__name__}")
 
-        # Run with uvicorn
-        uvicorn.run(app, host=host, port=port, log_level="info")
+        # Run with uvicorn. "auto" picks uvloop/httptools when installed
+        # (pip install "nadlan-mcp[http]") and falls back to asyncio/h11 otherwise.
+        # Stay single-process: MCP sessions and the Govmap rate limiter live in memory.
+        uvicorn.run(
+            app,
+            host=host,
+            port=port,
+            log_level="info",
+            loop="auto",
+            http="auto",
+            timeout_keep_alive=keep_alive,
+        )
     except Exception as e:
         logger.error(f"Failed to start HTTP server: {e}", exc_info=True)
         sys.exit(1)
@@ -4,19 +4,171 @@ Govmap API health check tests.
 These tests verify the Govmap API is working and hasn't changed significantly.
 Run periodically (e.g., weekly) with: pytest -m api_health
 
-IMPORTANT: These make real API calls and take longer to run.
+By default each test replays its recorded cassette from tests/cassettes/api_health/
+(and fails when none is recorded, so a health run never passes without checking
+anything). The weekly API Health workflow runs with
+--run-live, which makes real API calls and re-records the cassettes. The response
+time check only runs live.
 """
 
+from datetime import date, timedelta
+from pathlib import Path
+import statistics
+import time
+import unicodedata
+
 import pytest
 
 from nadlan_mcp.govmap import GovmapClient
 from nadlan_mcp.govmap.models import AutocompleteResponse, Deal
+from tests.vcr_config import my_vcr
+
+CASSETTE_DIR = Path(my_vcr.cassette_library_dir) / "api_health"
+
+# Known address with deal data; its closest polygon is resolved once per run
+HOLON_ADDRESS = "סוקולוב 38 חולון"
+
+# Addresses the deal checks start from; autocompleted once per run by `geocoded`
+GEOCODE_ADDRESSES = (
+    HOLON_ADDRESS,
+    "רוטשילד 1 תל אביב",
+    "דיזנגוף 50 תל אביב",
+    "חולון",
+    "תל אביב",
+)
+
+# Deals on or after this date count as recent (last 5 years)
+RECENT_CUTOFF = date.today() - timedelta(days=5 * 365)
 
 
-@pytest.fixture
+def _normalize_address(address):
+    """Normalize Hebrew address text (NFKC, collapsed whitespace) for cache keys."""
+    return " ".join(unicodedata.normalize("NFKC", address).split())
+
+
+def _use_cassette(config, name):
+    """Open cassette `name`: record live with --run-live, otherwise replay (fail if missing)."""
+    cassette_path = CASSETTE_DIR / f"{name}.yaml"
+    if config.getoption("--run-live"):
+        record_mode = "all"
+    elif cassette_path.exists():
+        record_mode = "none"
+    else:
+        # Skipping would let a health run with no cassettes pass while checking nothing
+        pytest.fail(
+            f"No cassette {cassette_path.name}: run with --run-live to check the live API "
+            "(and record it)",
+            pytrace=False,
+        )
+    return my_vcr.use_cassette(str(cassette_path), record_mode=record_mode)
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a real Govmap client (no mocking)."""
-    return GovmapClient()
+    """Create one real Govmap client (no mocking) shared by every health check.
+
+    Sharing the client keeps one session and one rate limiter for the whole run,
+    so back-to-back checks stay within the configured requests per second.
+    """
+    govmap_client = GovmapClient()
+    yield govmap_client
+    govmap_client.session.close()
+
+
+@pytest.fixture(autouse=True)
+def api_cassette(request, client):
+    """Replay recorded Govmap responses, or hit the live API with --run-live."""
+    with _use_cassette(request.config, request.node.name):
+        yield
+    # Pooled connections are bound to this cassette; drop them before the next test
+    client.session.close()
+
+
+@pytest.fixture(scope="session")
+def geocoded(request, client):
+    """
+    Autocomplete each setup address once per run, keyed by normalized text.
+
+    Recorded in its own cassette, so tests that only need coordinates reuse these
+    results instead of repeating the same autocomplete calls.
+    """
+    with _use_cassette(request.config, "geocoded"):
+        results = {
+            _normalize_address(address): client.autocomplete_address(address)
+            for address in GEOCODE_ADDRESSES
+        }
+    client.session.close()
+    return results
+
+
+@pytest.fixture(scope="session")
+def holon_polygon_id(request, client, geocoded):
+    """Polygon ID closest to HOLON_ADDRESS, shared by the street deal checks."""
+    response = geocoded[_normalize_address(HOLON_ADDRESS)]
+    assert len(response.results) > 0, "Autocomplete found no results"
+    coords = response.results[0].coordinates
+    assert coords is not None, "Address has no coordinates"
+
+    with _use_cassette(request.config, "holon_polygon_id"):
+        polygons = client.get_deals_by_radius((coords.longitude, coords.latitude), radius=50)
+    client.session.close()
+
+    assert len(polygons) > 0, "No polygons found"
+    polygon_id = polygons[0].get("polygon_id")
+    assert polygon_id is not None, "Polygon has no ID"
+    return polygon_id
+
+
+def _median_latency(func, *args, rounds=3, **kwargs):
+    """
+    Time func over a warmup call plus `rounds` measured calls and return the median.
+
+    A single wall-clock sample over the network is noisy (one retransmit or GC
+    pause trips a fixed threshold); the median of a few rounds is not.
+    """
+    func(*args, **kwargs)  # Warmup: connection setup is not part of the latency check
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _address_to_deals(client, geocoded, address, radius, limit):
+    """
+    Follow a geocoded address to nearby polygons and the closest polygon's street deals.
+
+    Each stage needs the previous stage's result, so the calls are sequential;
+    the chain stops at the first stage that comes back empty.
+
+    Returns:
+        Tuple of (coordinates, polygons, deals). coordinates is None and the
+        lists are empty when an earlier stage found nothing.
+    """
+    response = geocoded[_normalize_address(address)]
+    coords = response.results[0].coordinates if response.results else None
+    if coords is None:
+        return None, [], []
+
+    polygons = client.get_deals_by_radius((coords.longitude, coords.latitude), radius=radius)
+    if not polygons:
+        return coords, [], []
+
+    deals = client.get_street_deals(polygons[0].get("polygon_id"), limit=limit)
+    return coords, polygons, deals
+
+
+def _deals_near_or_skip(client, geocoded, address, radius, limit):
+    """Street deals for `address` via _address_to_deals; skip the test if any stage is empty."""
+    coords, polygons, deals = _address_to_deals(client, geocoded, address, radius, limit)
+    if coords is None:
+        pytest.skip("No coordinates")
+    if not polygons:
+        pytest.skip("No polygons")
+    if not deals:
+        pytest.skip("No deals")
+    return deals
 
 
 class TestAutocompleteAPIHealth:
@@ -77,24 +229,9 @@ class TestDealsAPIHealth:
         assert len(polygons) > 0
 
     @pytest.mark.api_health
-    def test_get_street_deals_works(self, client):
+    def test_get_street_deals_works(self, client, holon_polygon_id):
         """Verify get_street_deals returns deals."""
-        # First get a polygon ID from autocomplete
-        response = client.autocomplete_address("סוקולוב 38 חולון")
-        assert len(response.results) > 0
-
-        coords = response.results[0].coordinates
-        assert coords is not None, "Address has no coordinates"
-
-        # Get polygons near this address
-        polygons = client.get_deals_by_radius((coords.longitude, coords.latitude), radius=50)
-        assert len(polygons) > 0, "No polygons found"
-
-        # Get street deals for first polygon
-        polygon_id = polygons[0].get("polygon_id")
-        assert polygon_id is not None, "Polygon has no ID"
-
-        deals = client.get_street_deals(polygon_id, limit=10)
+        deals = client.get_street_deals(holon_polygon_id, limit=10)
 
         # Verify deals structure
         assert isinstance(deals, list)
@@ -105,26 +242,10 @@ class TestDealsAPIHealth:
             assert deal.deal_amount is not None
 
     @pytest.mark.api_health
-    def test_deal_model_fields_present(self, client):
+    def test_deal_model_fields_present(self, client, geocoded):
         """Verify Deal model has expected fields."""
         # Get some real deals
-        response = client.autocomplete_address("דיזנגוף 50 תל אביב")
-        if len(response.results) == 0:
-            pytest.skip("No autocomplete results")
-
-        coords = response.results[0].coordinates
-        if coords is None:
-            pytest.skip("No coordinates")
-
-        polygons = client.get_deals_by_radius((coords.longitude, coords.latitude), radius=50)
-        if len(polygons) == 0:
-            pytest.skip("No polygons")
-
-        polygon_id = polygons[0].get("polygon_id")
-        deals = client.get_street_deals(polygon_id, limit=5)
-
-        if len(deals) == 0:
-            pytest.skip("No deals found")
+        deals = _deals_near_or_skip(client, geocoded, "דיזנגוף 50 תל אביב", radius=50, limit=5)
 
         deal = deals[0]
 
@@ -147,25 +268,9 @@ class TestAPIDataQuality:
     """Test data quality from API."""
 
     @pytest.mark.api_health
-    def test_deal_amounts_reasonable(self, client):
+    def test_deal_amounts_reasonable(self, client, geocoded):
         """Verify deal amounts are in reasonable range."""
-        response = client.autocomplete_address("חולון")
-        if len(response.results) == 0:
-            pytest.skip("No results")
-
-        coords = response.results[0].coordinates
-        if coords is None:
-            pytest.skip("No coordinates")
-
-        polygons = client.get_deals_by_radius((coords.longitude, coords.latitude), radius=100)
-        if len(polygons) == 0:
-            pytest.skip("No polygons")
-
-        polygon_id = polygons[0].get("polygon_id")
-        deals = client.get_street_deals(polygon_id, limit=20)
-
-        if len(deals) == 0:
-            pytest.skip("No deals")
+        deals = _deals_near_or_skip(client, geocoded, "חולון", radius=100, limit=20)
 
         # Check deal amounts are reasonable (10K to 100M NIS)
         for deal in deals:
@@ -175,79 +280,50 @@ class TestAPIDataQuality:
                 )
 
     @pytest.mark.api_health
-    def test_dates_are_recent(self, client):
+    def test_dates_are_recent(self, client, geocoded):
         """Verify deals have recent dates."""
-        from datetime import date, timedelta
-
-        response = client.autocomplete_address("תל אביב")
-        if len(response.results) == 0:
-            pytest.skip("No results")
-
-        coords = response.results[0].coordinates
-        if coords is None:
-            pytest.skip("No coordinates")
+        deals = _deals_near_or_skip(client, geocoded, "תל אביב", radius=100, limit=50)
 
-        polygons = client.get_deals_by_radius((coords.longitude, coords.latitude), radius=100)
-        if len(polygons) == 0:
-            pytest.skip("No polygons")
-
-        polygon_id = polygons[0].get("polygon_id")
-        deals = client.get_street_deals(polygon_id, limit=50)
-
-        if len(deals) == 0:
-            pytest.skip("No deals")
-
-        # At least some deals should be from last 5 years
-        cutoff = date.today() - timedelta(days=5 * 365)
-        recent_deals = [d for d in deals if isinstance(d.deal_date, date) and d.deal_date >= cutoff]
-
-        assert len(recent_deals) > 0, "No recent deals found (within last 5 years)"
+        # At least some deals should be from last 5 years. Deal.deal_date is always a
+        # date, so stop at the first recent one instead of filtering the whole list.
+        assert any(deal.deal_date >= RECENT_CUTOFF for deal in deals), (
+            "No recent deals found (within last 5 years)"
+        )
 
 
 class TestAPIIntegration:
     """Test full integration workflows."""
 
     @pytest.mark.api_health
-    def test_full_address_to_deals_workflow(self, client):
+    def test_full_address_to_deals_workflow(self, client, geocoded):
         """Test complete workflow: address -> coordinates -> polygons -> deals."""
-        # Step 1: Autocomplete
-        response = client.autocomplete_address("רוטשילד 1 תל אביב")
-        assert len(response.results) > 0, "Autocomplete failed"
-
-        # Step 2: Get coordinates
-        coords = response.results[0].coordinates
+        coords, polygons, deals = _address_to_deals(
+            client, geocoded, "רוטשילד 1 תל אביב", radius=50, limit=10
+        )
         assert coords is not None, "No coordinates returned"
-
-        # Step 3: Get polygons
-        polygons = client.get_deals_by_radius((coords.longitude, coords.latitude), radius=50)
         assert len(polygons) > 0, "No polygons found"
 
-        # Step 4: Get deals
-        polygon_id = polygons[0].get("polygon_id")
-        deals = client.get_street_deals(polygon_id, limit=10)
-
         # Should complete without errors
         assert isinstance(deals, list), "Deals should be a list"
 
     @pytest.mark.api_health
-    def test_api_response_times_reasonable(self, client):
-        """Verify API responds within reasonable time."""
-        import time
+    def test_api_response_times_reasonable(self, request, client, geocoded):
+        """Verify API responds within reasonable time (median of a few rounds)."""
+        if not request.config.getoption("--run-live"):
+            pytest.skip("Cassette replay has no network latency to measure (use --run-live)")
 
         # Test autocomplete response time
-        start = time.time()
-        client.autocomplete_address("תל אביב")
-        autocomplete_time = time.time() - start
+        autocomplete_time = _median_latency(client.autocomplete_address, "תל אביב")
 
         assert autocomplete_time < 5.0, f"Autocomplete took {autocomplete_time:.2f}s (too slow)"
 
         # Test deals query response time
-        response = client.autocomplete_address("חולון")
+        response = geocoded[_normalize_address("חולון")]
         if len(response.results) > 0 and response.results[0].coordinates:
             coords = response.results[0].coordinates
 
-            start = time.time()
-            client.get_deals_by_radius((coords.longitude, coords.latitude), radius=50)
-            deals_time = time.time() - start
+            deals_time = _median_latency(
+                client.get_deals_by_radius, (coords.longitude, coords.latitude), radius=50
+            )
 
             assert deals_time < 10.0, f"Deals query took {deals_time:.2f}s (too slow)"
@@ -2,12 +2,42 @@
 Pytest configuration for nadlan_mcp tests.
 """
 
+import copy
+import json
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
 from tests.vcr_config import my_vcr
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--run-live",
+        action="store_true",
+        default=False,
+        help="Call the real Govmap API in api_health and E2E tests and re-record their cassettes",
+    )
+
+
+def _api_health_requested(config):
+    """True when the run selects the api_health marker or names the suite's path."""
+    markexpr = config.getoption("markexpr") or ""
+    if "api_health" in markexpr.replace("not api_health", ""):
+        return True
+    return any("api_health" in str(arg) for arg in config.args)
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Don't import the api_health suite unless the run asks for it."""
+    if "api_health" in collection_path.parts and not _api_health_requested(config):
+        return True
+    return None
+
 
 @pytest.fixture
 def mock_api_response():
@@ -17,50 +47,25 @@ def mock_api_response():
     return mock_response
 
 
-@pytest.fixture
-def sample_autocomplete_response():
-    """Fixture providing a sample autocomplete response."""
+@pytest.fixture(scope="session")
+def _sample_payloads():
+    """Load the sample API payloads from tests/fixtures once per session."""
     return {
-        "resultsCount": 1,
-        "results": [
-            {
-                "id": "address|ADDR|123|test",
-                "text": "תל אביב",
-                "type": "address",
-                "score": 100,
-                "shape": "POINT(3870000.123 3770000.456)",
-                "data": {},
-            }
-        ],
+        name: json.loads((FIXTURES_DIR / f"{name}.json").read_bytes())
+        for name in ("sample_autocomplete_response", "sample_deals_response")
     }
 
 
 @pytest.fixture
-def sample_deals_response():
-    """Fixture providing a sample deals response."""
-    return {
-        "totalCount": "2",
-        "data": [
-            {
-                "objectid": 123,
-                "dealAmount": 1000000,
-                "dealDate": "2025-01-01T00:00:00.000Z",
-                "assetArea": 100,
-                "settlementNameHeb": "תל אביב-יפו",
-                "propertyTypeDescription": "דירה",
-                "neighborhood": "test neighborhood",
-            },
-            {
-                "objectid": 456,
-                "dealAmount": 2000000,
-                "dealDate": "2025-01-15T00:00:00.000Z",
-                "assetArea": 120,
-                "settlementNameHeb": "תל אביב-יפو",
-                "propertyTypeDescription": "דירה",
-                "neighborhood": "test neighborhood",
-            },
-        ],
-    }
+def sample_autocomplete_response(_sample_payloads):
+    """Fixture providing a sample autocomplete response (a fresh copy per test)."""
+    return copy.deepcopy(_sample_payloads["sample_autocomplete_response"])
+
+
+@pytest.fixture
+def sample_deals_response(_sample_payloads):
+    """Fixture providing a sample deals response (a fresh copy per test)."""
+    return copy.deepcopy(_sample_payloads["sample_deals_response"])
 
 
 @pytest.fixture
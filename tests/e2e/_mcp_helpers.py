@@ -0,0 +1,56 @@
+"""
+Shared response checks for the E2E MCP tool tests.
+
+The smoke tests (small limits) and the comprehensive tests (full limits) assert the
+same response shapes, so both call these helpers instead of repeating the bodies.
+"""
+
+from nadlan_mcp.json_utils import loads
+
+
+def assert_autocomplete_results(result: str) -> list:
+    """Check an autocomplete_address response and return the parsed results."""
+    data = loads(result)
+
+    assert isinstance(data, list)
+    assert len(data) > 0
+
+    first = data[0]
+    assert "text" in first
+    assert "coordinates" in first or "id" in first
+    return data
+
+
+def assert_street_deals(result: str) -> dict:
+    """Check a get_street_deals response for a polygon known to have deals."""
+    data = loads(result)
+
+    assert "total_deals" in data
+    assert isinstance(data["total_deals"], int)
+    assert data["total_deals"] > 0  # Known polygon should have deals
+
+    assert "deals" in data
+    assert len(data["deals"]) > 0
+
+    # Check deal structure
+    deal = data["deals"][0]
+    assert "deal_amount" in deal
+    assert "deal_date" in deal
+    return data
+
+
+def assert_radius_polygons(result: str) -> dict:
+    """Check a get_deals_by_radius response for coordinates known to have polygons."""
+    data = loads(result)
+
+    assert "total_polygons" in data
+    assert isinstance(data["total_polygons"], int)
+    assert data["total_polygons"] > 0  # Known coords should have polygons
+
+    assert "polygons" in data
+    assert len(data["polygons"]) > 0
+
+    # Check polygon metadata structure
+    polygon = data["polygons"][0]
+    assert "polygon_id" in polygon or "objectid" in polygon
+    return data
@@ -0,0 +1,53 @@
+"""
+Pytest configuration for the E2E MCP tool tests.
+
+Integration tests here run inside a VCR cassette under tests/cassettes/e2e/. By default
+a test replays its cassette, or is skipped when none is recorded; it never touches the
+network. Pass --run-live to call the real API and (re-)record. Recorded cassettes are
+gitignored.
+
+The MCP server module (and the mcp/FastMCP stack behind it) is imported by the
+`mcp_tools` fixture rather than at module level, so collecting these tests stays cheap.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from tests.vcr_config import my_vcr
+
+CASSETTE_DIR = Path(my_vcr.cassette_library_dir) / "e2e"
+
+# Autocomplete and geocode calls are POSTs to one URL that differ only by body, and
+# compare_addresses issues them from several threads: match on the body too, so each
+# address replays its own responses whatever order the threads run in
+E2E_MATCH_ON = (*my_vcr.match_on, "body")
+
+
+@pytest.fixture(scope="session")
+def mcp_tools():
+    """The nadlan_mcp.fastmcp_server module, imported on first use."""
+    from nadlan_mcp import fastmcp_server
+
+    return fastmcp_server
+
+
+@pytest.fixture(autouse=True)
+def e2e_cassette(request, mcp_tools):
+    """Record/replay the Govmap calls of each integration test."""
+    if request.node.get_closest_marker("integration") is None:
+        yield
+        return
+
+    # One folder per test module keeps the smoke and comprehensive cassettes apart
+    cassette_path = CASSETTE_DIR / request.node.path.stem / f"{request.node.name}.yaml"
+    if request.config.getoption("--run-live"):
+        record_mode = "all"
+    elif cassette_path.exists():
+        record_mode = "none"
+    else:
+        pytest.skip(f"No cassette {cassette_path.name} (record it with --run-live)")
+    with my_vcr.use_cassette(str(cassette_path), record_mode=record_mode, match_on=E2E_MATCH_ON):
+        yield
+    # Pooled connections are bound to this cassette; drop them before the next test
+    mcp_tools.client.session.close()
@@ -4,29 +4,23 @@ End-to-end tests for all MCP tools.
 These tests make real API calls to verify the complete functionality
 of each MCP tool from end to end.
 
-Mark as integration tests since they hit real APIs.
+Mark as integration tests since they hit real APIs, and as slow so the default
+integration run only executes the smoke tests in test_mcp_tools.py.
 """
 
-import json
-
 import pytest
 
 from nadlan_mcp.config import get_config
-from nadlan_mcp.fastmcp_server import (
-    analyze_market_trends,
-    autocomplete_address,
-    compare_addresses,
-    find_recent_deals_for_address,
-    get_deal_statistics,
-    get_deals_by_radius,
-    get_market_activity_metrics,
-    get_neighborhood_deals,
-    get_street_deals,
-    get_valuation_comparables,
+from nadlan_mcp.json_utils import loads
+from tests.e2e._mcp_helpers import (
+    assert_autocomplete_results,
+    assert_radius_polygons,
+    assert_street_deals,
 )
 
 
 @pytest.mark.integration
+@pytest.mark.slow
 class TestMCPToolsE2E:
     """End-to-end tests for all 10 MCP tools."""
 
@@ -38,23 +32,14 @@ class TestMCPToolsE2E:
     TEST_LAT = 3766290.19
     TEST_LON = 3870928.84
 
-    def test_autocomplete_address(self):
+    def test_autocomplete_address(self, mcp_tools):
         """Test address autocomplete returns results."""
-        result = autocomplete_address("חולון סוקולוב")
-        data = json.loads(result)
-
-        assert isinstance(data, list)
-        assert len(data) > 0
+        assert_autocomplete_results(mcp_tools.autocomplete_address("חולון סוקולוב"))
 
-        # Check first result has expected structure
-        first = data[0]
-        assert "text" in first
-        assert "coordinates" in first or "id" in first
-
-    def test_find_recent_deals_for_address(self):
+    def test_find_recent_deals_for_address(self, mcp_tools):
         """Test finding recent deals for an address."""
-        result = find_recent_deals_for_address(self.TEST_ADDRESS_1, max_deals=100)
-        data = json.loads(result)
+        result = mcp_tools.find_recent_deals_for_address(self.TEST_ADDRESS_1, max_deals=100)
+        data = loads(result)
 
         # Check response structure
         assert "search_parameters" in data
@@ -71,10 +56,12 @@ class TestMCPToolsE2E:
         assert "deal_date" in deal
         assert "settlement_name_heb" in deal
 
-    def test_analyze_market_trends(self):
+    def test_analyze_market_trends(self, mcp_tools):
         """Test market trend analysis."""
-        result = analyze_market_trends(self.TEST_ADDRESS_1, years_back=3, radius_meters=100)
-        data = json.loads(result)
+        result = mcp_tools.analyze_market_trends(
+            self.TEST_ADDRESS_1, years_back=3, radius_meters=100
+        )
+        data = loads(result)
 
         # Check response structure (normalized in MCP_NORMALIZATION_FIX)
         assert "market_statistics" in data
@@ -83,12 +70,12 @@ class TestMCPToolsE2E:
         assert isinstance(data["market_statistics"]["deal_breakdown"]["total_deals"], int)
         assert data["market_statistics"]["deal_breakdown"]["total_deals"] >= 0
 
-    def test_get_valuation_comparables(self):
+    def test_get_valuation_comparables(self, mcp_tools):
         """Test getting valuation comparables."""
-        result = get_valuation_comparables(
+        result = mcp_tools.get_valuation_comparables(
             self.TEST_ADDRESS_1, years_back=3, min_rooms=3.0, max_rooms=5.0
         )
-        data = json.loads(result)
+        data = loads(result)
 
         # Normalized structure: total_comparables -> market_statistics.deal_breakdown.total_deals
         assert "market_statistics" in data
@@ -118,10 +105,10 @@ class TestMCPToolsE2E:
             # Just verify the comparable has basic required fields
             assert "deal_date" in comp
 
-    def test_get_deal_statistics(self):
+    def test_get_deal_statistics(self, mcp_tools):
         """Test deal statistics calculation."""
-        result = get_deal_statistics(self.TEST_ADDRESS_1, years_back=3)
-        data = json.loads(result)
+        result = mcp_tools.get_deal_statistics(self.TEST_ADDRESS_1, years_back=3)
+        data = loads(result)
 
         # Check response structure (normalized: statistics -> market_statistics)
         assert "market_statistics" in data
@@ -131,52 +118,41 @@ class TestMCPToolsE2E:
             assert isinstance(data["market_statistics"]["deal_breakdown"]["total_deals"], int)
             assert data["market_statistics"]["deal_breakdown"]["total_deals"] >= 0
 
-    def test_get_market_activity_metrics(self):
+    def test_get_market_activity_metrics(self, mcp_tools):
         """Test market activity metrics."""
 
         if not get_config().tool_get_market_activity_metrics_enabled:
             pytest.skip("test_get_market_activity tool is disabled")
-        result = get_market_activity_metrics(self.TEST_ADDRESS_1, years_back=3)
-        data = json.loads(result)
+        result = mcp_tools.get_market_activity_metrics(self.TEST_ADDRESS_1, years_back=3)
+        data = loads(result)
 
         # Check response structure
         assert "market_activity" in data
         if data["market_activity"] is not None:
             assert "activity_score" in data["market_activity"]
 
-    def test_compare_addresses(self):
+    def test_compare_addresses(self, mcp_tools):
         """Test comparing multiple addresses."""
-        result = compare_addresses([self.TEST_ADDRESS_1, self.TEST_ADDRESS_2])
-        data = json.loads(result)
+        result = mcp_tools.compare_addresses([self.TEST_ADDRESS_1, self.TEST_ADDRESS_2])
+        data = loads(result)
 
         assert isinstance(data, dict)
         assert "addresses_compared" in data
         assert "all_results" in data
 
-    def test_get_street_deals(self):
+    def test_get_street_deals(self, mcp_tools):
         """Test getting street-level deals."""
 
         if not get_config().tool_get_street_deals_enabled:
             pytest.skip("test_get_street_deals tool is disabled")
-        result = get_street_deals(self.TEST_POLYGON_ID, limit=100, deal_type=2)
-        data = json.loads(result)
-
-        assert "total_deals" in data
-        assert isinstance(data["total_deals"], int)
-        assert data["total_deals"] > 0  # Known polygon should have deals
-
-        assert "deals" in data
-        assert len(data["deals"]) > 0
-
-        # Check deal structure
-        deal = data["deals"][0]
-        assert "deal_amount" in deal
-        assert "deal_date" in deal
+        assert_street_deals(
+            mcp_tools.get_street_deals(self.TEST_POLYGON_ID, limit=100, deal_type=2)
+        )
 
-    def test_get_neighborhood_deals(self):
+    def test_get_neighborhood_deals(self, mcp_tools):
         """Test getting neighborhood-level deals."""
-        result = get_neighborhood_deals(self.TEST_POLYGON_ID, limit=100, deal_type=2)
-        data = json.loads(result)
+        result = mcp_tools.get_neighborhood_deals(self.TEST_POLYGON_ID, limit=100, deal_type=2)
+        data = loads(result)
 
         assert "total_deals" in data
         assert isinstance(data["total_deals"], int)
@@ -185,33 +161,11 @@ class TestMCPToolsE2E:
         assert "deals" in data
         assert len(data["deals"]) > 0
 
-    def test_get_deals_by_radius(self):
+    def test_get_deals_by_radius(self, mcp_tools):
         """Test getting polygon metadata by radius."""
 
         if not get_config().tool_get_deals_by_radius_enabled:
             pytest.skip("test_get_deals_by_radius tool is disabled")
-        result = get_deals_by_radius(self.TEST_LAT, self.TEST_LON, radius_meters=500)
-        data = json.loads(result)
-
-        assert "total_polygons" in data
-        assert isinstance(data["total_polygons"], int)
-        assert data["total_polygons"] > 0  # Known coords should have polygons
-
-        assert "polygons" in data
-        assert len(data["polygons"]) > 0
-
-        # Check polygon metadata structure
-        polygon = data["polygons"][0]
-        assert "polygon_id" in polygon or "objectid" in polygon
-
-    def test_get_deals_by_radius_no_results(self):
-        """Test get_deals_by_radius with coords that have no data."""
-        if not get_config().tool_get_deals_by_radius_enabled:
-            pytest.skip("test_get_deals_by_radius tool is disabled")
-
-        # Use coordinates unlikely to have data
-        result = get_deals_by_radius(37.66, 38.71, radius_meters=10)
-
-        # Should return a message string, not JSON
-        assert isinstance(result, str)
-        assert "No polygons found" in result or "total_polygons" in result
+        assert_radius_polygons(
+            mcp_tools.get_deals_by_radius(self.TEST_LAT, self.TEST_LON, radius_meters=500)
+        )
@@ -10,65 +10,67 @@ from nadlan_mcp.govmap.filters import filter_deals_by_criteria
 from nadlan_mcp.govmap.models import Deal, DealFilters
 
 
+@pytest.fixture(scope="module")
+def sample_deals():
+    """Create sample deals once for the module; tests only read them."""
+    return [
+        Deal(
+            objectid=1,
+            deal_amount=1000000.0,
+            deal_date="2024-01-15",
+            property_type_description="דירה",
+            rooms=3.0,
+            asset_area=80.0,
+            floor_number=2,
+        ),
+        Deal(
+            objectid=2,
+            deal_amount=1500000.0,
+            deal_date="2024-02-01",
+            property_type_description="דירת גג",
+            rooms=4.0,
+            asset_area=100.0,
+            floor_number=5,
+        ),
+        Deal(
+            objectid=3,
+            deal_amount=2000000.0,
+            deal_date="2024-02-15",
+            property_type_description="בית פרטי",
+            rooms=5.0,
+            asset_area=150.0,
+            floor_number=0,  # Ground floor
+        ),
+        Deal(
+            objectid=4,
+            deal_amount=800000.0,
+            deal_date="2024-03-01",
+            property_type_description="דירה",
+            rooms=2.0,
+            asset_area=60.0,
+            floor_number=1,
+        ),
+        Deal(
+            objectid=5,
+            deal_amount=1200000.0,
+            deal_date="2024-03-15",
+            property_type_description="פנטהאוז",
+            rooms=4.5,
+            asset_area=120.0,
+            floor_number=10,
+        ),
+    ]
+
+
 class TestFilterDealsByCriteria:
     """Test cases for filter_deals_by_criteria function."""
 
-    @pytest.fixture
-    def sample_deals(self):
-        """Create sample deals for testing."""
-        return [
-            Deal(
-                objectid=1,
-                deal_amount=1000000.0,
-                deal_date="2024-01-15",
-                property_type_description="דירה",
-                rooms=3.0,
-                asset_area=80.0,
-                floor_number=2,
-            ),
-            Deal(
-                objectid=2,
-                deal_amount=1500000.0,
-                deal_date="2024-02-01",
-                property_type_description="דירת גג",
-                rooms=4.0,
-                asset_area=100.0,
-                floor_number=5,
-            ),
-            Deal(
-                objectid=3,
-                deal_amount=2000000.0,
-                deal_date="2024-02-15",
-                property_type_description="בית פרטי",
-                rooms=5.0,
-                asset_area=150.0,
-                floor_number=0,  # Ground floor
-            ),
-            Deal(
-                objectid=4,
-                deal_amount=800000.0,
-                deal_date="2024-03-01",
-                property_type_description="דירה",
-                rooms=2.0,
-                asset_area=60.0,
-                floor_number=1,
-            ),
-            Deal(
-                objectid=5,
-                deal_amount=1200000.0,
-                deal_date="2024-03-15",
-                property_type_description="פנטהאוז",
-                rooms=4.5,
-                asset_area=120.0,
-                floor_number=10,
-            ),
-        ]
-
     def test_no_filters_returns_all_deals(self, sample_deals):
         """Test that with no filters, all deals are returned."""
         result = filter_deals_by_criteria(sample_deals)
         assert len(result) == 5
         assert result == sample_deals
+        assert result is not sample_deals  # New list, safe for callers to modify
 
     def test_filter_by_property_type_exact_match(self, sample_deals):
         """Test filtering by exact property type."""
@@ -83,23 +85,22 @@ class TestFilterDealsByCriteria:
         assert len(result) == 3
         assert {d.objectid for d in result} == {1, 2, 4}
 
-    def test_filter_by_min_rooms(self, sample_deals):
-        """Test filtering by minimum rooms."""
-        result = filter_deals_by_criteria(sample_deals, min_rooms=4.0)
-        assert len(result) == 3
-        assert {d.objectid for d in result} == {2, 3, 5}
-
-    def test_filter_by_max_rooms(self, sample_deals):
-        """Test filtering by maximum rooms."""
-        result = filter_deals_by_criteria(sample_deals, max_rooms=3.0)
-        assert len(result) == 2
-        assert {d.objectid for d in result} == {1, 4}
-
-    def test_filter_by_room_range(self, sample_deals):
-        """Test filtering by room range."""
-        result = filter_deals_by_criteria(sample_deals, min_rooms=3.0, max_rooms=4.0)
-        assert len(result) == 2
-        assert {d.objectid for d in result} == {1, 2}
+    @pytest.mark.parametrize(
+        "min_rooms,max_rooms,expected_ids",
+        [
+            (None, None, {1, 2, 3, 4, 5}),  # No filter
+            (4.0, None, {2, 3, 5}),  # Min only
+            (3.0, None, {1, 2, 3, 5}),  # Min only, inclusive bound
+            (None, 3.0, {1, 4}),  # Max only
+            (None, 4.0, {1, 2, 4}),  # Max only, inclusive bound
+            (3.0, 4.0, {1, 2}),  # Range
+            (10.0, 20.0, set()),  # No matches
+        ],
+    )
+    def test_room_filtering(self, sample_deals, min_rooms, max_rooms, expected_ids):
+        """Test filtering by minimum rooms, maximum rooms and room range."""
+        result = filter_deals_by_criteria(sample_deals, min_rooms=min_rooms, max_rooms=max_rooms)
+        assert {d.objectid for d in result} == expected_ids
 
     def test_filter_by_min_price(self, sample_deals):
         """Test filtering by minimum price."""
@@ -299,18 +300,3 @@ class TestFilterDealsByCriteria:
         # Should match ground (0) and floor 3, but not basement (-1)
         assert len(result) == 2
         assert {d.objectid for d in result} == {1, 2}
-
-    @pytest.mark.parametrize(
-        "min_val,max_val,expected_count",
-        [
-            (None, None, 5),  # No filter
-            (3.0, 4.0, 2),  # Range
-            (3.0, None, 4),  # Min only
-            (None, 4.0, 3),  # Max only
-            (10.0, 20.0, 0),  # No matches
-        ],
-    )
-    def test_room_filtering_parametrized(self, sample_deals, min_val, max_val, expected_count):
-        """Parametrized test for room filtering."""
-        result = filter_deals_by_criteria(sample_deals, min_rooms=min_val, max_rooms=max_val)
-        assert len(result) == expected_count
@@ -4,7 +4,9 @@ Tests for nadlan_mcp.govmap.market_analysis module.
 Comprehensive tests for market analysis functions.
 """
 
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
+import math
 
 import pytest
 
@@ -16,62 +18,128 @@ from nadlan_mcp.govmap.market_analysis import (
 )
 from nadlan_mcp.govmap.models import Deal, InvestmentAnalysis, LiquidityMetrics, MarketActivityScore
 
+# Reference date for all relative test dates, taken once at import
+TODAY = date.today()
+
+# First day of each month of 2024, for the fixed-date investment tests
+MONTH_STARTS_2024 = tuple(date(2024, month, 1) for month in range(1, 13))
+
 
 def get_recent_date(months_ago=0, days_ago=0):
     """Helper to get recent dates for testing."""
-    return (datetime.now() - timedelta(days=months_ago * 30 + days_ago)).date()
+    return TODAY - timedelta(days=months_ago * 30 + days_ago)
+
+
+@lru_cache(maxsize=None)
+def _spread_deals(num_deals, months):
+    return tuple(
+        Deal(
+            objectid=i,
+            deal_amount=1000000,
+            deal_date=get_recent_date(months_ago=i % months, days_ago=(i // months) % 28),
+            asset_area=80,
+        )
+        for i in range(num_deals)
+    )
+
+
+def spread_deals(num_deals, months):
+    """Build num_deals identical deals spread round-robin over the last `months` months.
+
+    Each (num_deals, months) set is built once per run and shared; the analysis
+    functions only read deals, so tests get a fresh list over the same models.
+    """
+    return list(_spread_deals(num_deals, months))
+
+
+def trend_deals(deals_per_month):
+    """Build deals from counts per month, oldest month first, ending with the current month."""
+    months = len(deals_per_month)
+    slots = [
+        (months - 1 - index, day)
+        for index, count in enumerate(deals_per_month)
+        for day in range(count)
+    ]
+    return [
+        Deal(
+            objectid=objectid,
+            deal_amount=1000000,
+            deal_date=get_recent_date(months_ago=months_ago, days_ago=day),
+            asset_area=80,
+        )
+        for objectid, (months_ago, day) in enumerate(slots)
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_deals():
+    """Create sample deals spanning multiple months (recent dates)."""
+    return [
+        Deal(
+            objectid=1,
+            deal_amount=1000000,
+            deal_date=get_recent_date(months_ago=4, days_ago=5),
+            asset_area=80,
+        ),
+        Deal(
+            objectid=2,
+            deal_amount=1100000,
+            deal_date=get_recent_date(months_ago=3, days_ago=5),
+            asset_area=85,
+        ),
+        Deal(
+            objectid=3,
+            deal_amount=1200000,
+            deal_date=get_recent_date(months_ago=2, days_ago=5),
+            asset_area=90,
+        ),
+        Deal(
+            objectid=4,
+            deal_amount=1300000,
+            deal_date=get_recent_date(months_ago=1, days_ago=5),
+            asset_area=95,
+        ),
+        Deal(
+            objectid=5,
+            deal_amount=1400000,
+            deal_date=get_recent_date(months_ago=0, days_ago=5),
+            asset_area=100,
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def twelve_monthly_deals():
+    """12 deals spread evenly across the last 12 months (one per month)."""
+    return spread_deals(12, months=12)
+
+
+@pytest.fixture(scope="module")
+def twelve_monthly_liquidity(twelve_monthly_deals):
+    """get_market_liquidity(twelve_monthly_deals), computed once for the tests that read it."""
+    return get_market_liquidity(twelve_monthly_deals, time_period_months=12)
+
+
+@pytest.fixture(scope="module")
+def parsed_sample(sample_deals):
+    """parse_deal_dates(sample_deals), computed once for the tests that only read it."""
+    return parse_deal_dates(sample_deals)
 
 
 class TestParseDealDates:
     """Test cases for parse_deal_dates helper function."""
 
-    @pytest.fixture
-    def sample_deals(self):
-        """Create sample deals spanning multiple months (recent dates)."""
-        return [
-            Deal(
-                objectid=1,
-                deal_amount=1000000,
-                deal_date=get_recent_date(months_ago=4, days_ago=5),
-                asset_area=80,
-            ),
-            Deal(
-                objectid=2,
-                deal_amount=1100000,
-                deal_date=get_recent_date(months_ago=3, days_ago=5),
-                asset_area=85,
-            ),
-            Deal(
-                objectid=3,
-                deal_amount=1200000,
-                deal_date=get_recent_date(months_ago=2, days_ago=5),
-                asset_area=90,
-            ),
-            Deal(
-                objectid=4,
-                deal_amount=1300000,
-                deal_date=get_recent_date(months_ago=1, days_ago=5),
-                asset_area=95,
-            ),
-            Deal(
-                objectid=5,
-                deal_amount=1400000,
-                deal_date=get_recent_date(months_ago=0, days_ago=5),
-                asset_area=100,
-            ),
-        ]
-
-    def test_parse_deal_dates_basic(self, sample_deals):
+    def test_parse_deal_dates_basic(self, parsed_sample):
         """Test basic date parsing functionality."""
-        deal_dates, monthly, quarterly = parse_deal_dates(sample_deals)
+        deal_dates, monthly, quarterly = parsed_sample
 
         assert len(deal_dates) == 5
         assert len(monthly) >= 4  # At least 4 different months
         assert len(quarterly) >= 1  # At least 1 quarter
 
-    def test_parse_deal_dates_quarterly_grouping(self, sample_deals):
+    def test_parse_deal_dates_quarterly_grouping(self, parsed_sample):
         """Test quarterly grouping."""
-        _, _, quarterly = parse_deal_dates(sample_deals)
+        _, _, quarterly = parsed_sample
 
         assert len(quarterly) >= 1  # At least one quarter represented
 
@@ -85,7 +153,7 @@ class TestParseDealDates:
 
     def test_parse_deal_dates_with_date_objects(self):
         """Test parsing with date objects instead of strings."""
-        recent = datetime.now().date()
+        recent = TODAY
         deals = [
             Deal(
                 objectid=1,
@@ -133,19 +201,9 @@ class TestParseDealDates:
 class TestCalculateMarketActivityScore:
     """Test cases for calculate_market_activity_score function."""
 
-    def test_market_activity_basic(self):
+    def test_market_activity_basic(self, twelve_monthly_deals):
         """Test basic market activity calculation."""
-        # Create 12 deals spread across last 12 months
-        deals = [
-            Deal(
-                objectid=i,
-                deal_amount=1000000,
-                deal_date=get_recent_date(months_ago=i),
-                asset_area=80,
-            )
-            for i in range(12)
-        ]
-        score = calculate_market_activity_score(deals, time_period_months=12)
+        score = calculate_market_activity_score(twelve_monthly_deals, time_period_months=12)
 
         assert isinstance(score, MarketActivityScore)
         assert score.total_deals == 12
@@ -156,18 +214,7 @@ class TestCalculateMarketActivityScore:
     def test_market_activity_high_volume(self):
         """Test activity score with high volume."""
         # Create 120 deals spread across last 10 months = ~12 deals/month (very high)
-        deals = []
-        for i in range(120):
-            month_ago = i % 10
-            day = (i % 28) + 1
-            deals.append(
-                Deal(
-                    objectid=i,
-                    deal_amount=1000000,
-                    deal_date=get_recent_date(months_ago=month_ago, days_ago=day),
-                    asset_area=80,
-                )
-            )
+        deals = spread_deals(120, months=10)
         score = calculate_market_activity_score(deals, time_period_months=12)
 
         assert score.activity_score == 100.0  # Should max out at 100
@@ -195,40 +242,16 @@ class TestCalculateMarketActivityScore:
 
     def test_market_activity_trend_increasing(self):
         """Test trend detection - increasing activity."""
-        # More deals in recent months (month 0 is most recent)
-        deals = []
-        for i in range(12):
-            months_ago = 11 - i  # Start from 11 months ago
-            num_deals = i + 1  # Increasing: 1 deal earliest, 12 deals most recent
-            for j in range(num_deals):
-                deals.append(
-                    Deal(
-                        objectid=len(deals),
-                        deal_amount=1000000,
-                        deal_date=get_recent_date(months_ago=months_ago, days_ago=j),
-                        asset_area=80,
-                    )
-                )
+        # More deals in recent months: 1 deal 11 months ago ... 12 deals this month
+        deals = trend_deals(range(1, 13))
 
         score = calculate_market_activity_score(deals, time_period_months=12)
         assert score.trend == "increasing"
 
     def test_market_activity_trend_decreasing(self):
         """Test trend detection - decreasing activity."""
-        # Fewer deals in recent months
-        deals = []
-        for i in range(12):
-            months_ago = 11 - i  # Start from 11 months ago
-            num_deals = 12 - i  # Decreasing: 12 deals earliest, 1 deal most recent
-            for j in range(num_deals):
-                deals.append(
-                    Deal(
-                        objectid=len(deals),
-                        deal_amount=1000000,
-                        deal_date=get_recent_date(months_ago=months_ago, days_ago=j),
-                        asset_area=80,
-                    )
-                )
+        # Fewer deals in recent months: 12 deals 11 months ago ... 1 deal this month
+        deals = trend_deals(range(12, 0, -1))
 
         score = calculate_market_activity_score(deals, time_period_months=12)
         assert score.trend == "decreasing"
@@ -238,9 +261,8 @@ class TestCalculateMarketActivityScore:
         # Create exactly one deal per month for 12 months using recent dates
         # Use 15th of each month to ensure consistent month grouping
         # Manually calculate year-month combinations going back 12 months
-        now = datetime.now()
-        current_year = now.year
-        current_month = now.month
+        current_year = TODAY.year
+        current_month = TODAY.month
 
         deals = []
         for i in range(12):
@@ -255,7 +277,7 @@ class TestCalculateMarketActivityScore:
                 Deal(
                     objectid=i,
                     deal_amount=1000000,
-                    deal_date=datetime(year, month, 15).date(),
+                    deal_date=date(year, month, 15),
                     asset_area=80,
                 )
             )
@@ -304,18 +326,7 @@ class TestCalculateMarketActivityScore:
     )
     def test_market_activity_deals_per_month(self, num_deals, months, expected_dpm_range):
         """Parametrized test for deals per month calculation."""
-        deals = []
-        for i in range(num_deals):
-            month_ago = i % months
-            day = (i // months) % 28
-            deals.append(
-                Deal(
-                    objectid=i,
-                    deal_amount=1000000,
-                    deal_date=get_recent_date(months_ago=month_ago, days_ago=day),
-                    asset_area=80,
-                )
-            )
+        deals = spread_deals(num_deals, months)
         score = calculate_market_activity_score(deals, time_period_months=12)
 
         assert expected_dpm_range[0] <= score.deals_per_month <= expected_dpm_range[1]
@@ -329,13 +340,13 @@ class TestAnalyzeInvestmentPotential:
         # Create deals with increasing prices
         deals = [
             Deal(
-                objectid=1, deal_amount=1000000, deal_date="2024-01-01", asset_area=100
+                objectid=1, deal_amount=1000000, deal_date=MONTH_STARTS_2024[0], asset_area=100
             ),  # 10000/sqm
             Deal(
-                objectid=2, deal_amount=1100000, deal_date="2024-02-01", asset_area=100
+                objectid=2, deal_amount=1100000, deal_date=MONTH_STARTS_2024[1], asset_area=100
             ),  # 11000/sqm
             Deal(
-                objectid=3, deal_amount=1200000, deal_date="2024-03-01", asset_area=100
+                objectid=3, deal_amount=1200000, deal_date=MONTH_STARTS_2024[2], asset_area=100
             ),  # 12000/sqm
         ]
         analysis = analyze_investment_potential(deals)
@@ -346,31 +357,6 @@ class TestAnalyzeInvestmentPotential:
         assert analysis.price_appreciation_rate > 0
         assert 0 <= analysis.investment_score <= 100
 
-    def test_investment_analysis_declining_prices(self):
-        """Test investment analysis with declining prices."""
-        deals = [
-            Deal(objectid=1, deal_amount=1200000, deal_date="2024-01-01", asset_area=100),
-            Deal(objectid=2, deal_amount=1100000, deal_date="2024-02-01", asset_area=100),
-            Deal(objectid=3, deal_amount=1000000, deal_date="2024-03-01", asset_area=100),
-        ]
-        analysis = analyze_investment_potential(deals)
-
-        assert analysis.price_trend == "decreasing"
-        assert analysis.price_appreciation_rate < 0
-        assert analysis.price_change_pct < 0
-
-    def test_investment_analysis_stable_prices(self):
-        """Test investment analysis with stable prices."""
-        deals = [
-            Deal(objectid=1, deal_amount=1000000, deal_date="2024-01-01", asset_area=100),
-            Deal(objectid=2, deal_amount=1005000, deal_date="2024-02-01", asset_area=100),
-            Deal(objectid=3, deal_amount=1000000, deal_date="2024-03-01", asset_area=100),
-        ]
-        analysis = analyze_investment_potential(deals)
-
-        assert analysis.price_trend == "stable"
-        assert -2 <= analysis.price_appreciation_rate <= 2
-
     def test_investment_analysis_volatility_low(self):
         """Test volatility calculation with low volatility."""
         # Prices very similar
@@ -378,7 +364,7 @@ class TestAnalyzeInvestmentPotential:
             Deal(
                 objectid=i,
                 deal_amount=1000000 + i * 1000,
-                deal_date=f"2024-{i + 1:02d}-01",
+                deal_date=MONTH_STARTS_2024[i],
                 asset_area=100,
             )
             for i in range(5)
@@ -392,10 +378,10 @@ class TestAnalyzeInvestmentPotential:
         """Test volatility calculation with high volatility."""
         # Prices vary wildly
         deals = [
-            Deal(objectid=1, deal_amount=800000, deal_date="2024-01-01", asset_area=100),
-            Deal(objectid=2, deal_amount=1500000, deal_date="2024-02-01", asset_area=100),
-            Deal(objectid=3, deal_amount=900000, deal_date="2024-03-01", asset_area=100),
-            Deal(objectid=4, deal_amount=1400000, deal_date="2024-04-01", asset_area=100),
+            Deal(objectid=1, deal_amount=800000, deal_date=MONTH_STARTS_2024[0], asset_area=100),
+            Deal(objectid=2, deal_amount=1500000, deal_date=MONTH_STARTS_2024[1], asset_area=100),
+            Deal(objectid=3, deal_amount=900000, deal_date=MONTH_STARTS_2024[2], asset_area=100),
+            Deal(objectid=4, deal_amount=1400000, deal_date=MONTH_STARTS_2024[3], asset_area=100),
         ]
         analysis = analyze_investment_potential(deals)
 
@@ -408,7 +394,7 @@ class TestAnalyzeInvestmentPotential:
             Deal(
                 objectid=i,
                 deal_amount=1000000,
-                deal_date=f"2024-{(i % 12) + 1:02d}-01",
+                deal_date=MONTH_STARTS_2024[i % 12],
                 asset_area=100,
             )
             for i in range(25)
@@ -421,9 +407,9 @@ class TestAnalyzeInvestmentPotential:
     def test_investment_analysis_data_quality_limited(self):
         """Test data quality assessment with limited data."""
         deals = [
-            Deal(objectid=1, deal_amount=1000000, deal_date="2024-01-01", asset_area=100),
-            Deal(objectid=2, deal_amount=1100000, deal_date="2024-02-01", asset_area=100),
-            Deal(objectid=3, deal_amount=1200000, deal_date="2024-03-01", asset_area=100),
+            Deal(objectid=1, deal_amount=1000000, deal_date=MONTH_STARTS_2024[0], asset_area=100),
+            Deal(objectid=2, deal_amount=1100000, deal_date=MONTH_STARTS_2024[1], asset_area=100),
+            Deal(objectid=3, deal_amount=1200000, deal_date=MONTH_STARTS_2024[2], asset_area=100),
         ]
         analysis = analyze_investment_potential(deals)
 
@@ -433,8 +419,8 @@ class TestAnalyzeInvestmentPotential:
     def test_investment_analysis_insufficient_data_raises_error(self):
         """Test that insufficient data raises error."""
         deals = [
-            Deal(objectid=1, deal_amount=1000000, deal_date="2024-01-01", asset_area=100),
-            Deal(objectid=2, deal_amount=1100000, deal_date="2024-02-01", asset_area=100),
+            Deal(objectid=1, deal_amount=1000000, deal_date=MONTH_STARTS_2024[0], asset_area=100),
+            Deal(objectid=2, deal_amount=1100000, deal_date=MONTH_STARTS_2024[1], asset_area=100),
         ]
         with pytest.raises(ValueError, match="Insufficient data"):
             analyze_investment_potential(deals)
@@ -448,47 +434,47 @@ class TestAnalyzeInvestmentPotential:
         """Test that deals without price_per_sqm raise error."""
         # Deals without asset_area won't have price_per_sqm
         deals = [
-            Deal(objectid=1, deal_amount=1000000, deal_date="2024-01-01"),
-            Deal(objectid=2, deal_amount=1100000, deal_date="2024-02-01"),
-            Deal(objectid=3, deal_amount=1200000, deal_date="2024-03-01"),
+            Deal(objectid=1, deal_amount=1000000, deal_date=MONTH_STARTS_2024[0]),
+            Deal(objectid=2, deal_amount=1100000, deal_date=MONTH_STARTS_2024[1]),
+            Deal(objectid=3, deal_amount=1200000, deal_date=MONTH_STARTS_2024[2]),
         ]
         with pytest.raises(ValueError, match="Insufficient data"):
             analyze_investment_potential(deals)
 
     @pytest.mark.parametrize(
-        "price_changes,expected_trend",
+        "price_changes,expected_trend,rate_bounds,change_pct_bounds",
         [
-            ([1000000, 1100000, 1200000], "increasing"),  # +20%
-            ([1200000, 1100000, 1000000], "decreasing"),  # -20%
-            ([1000000, 1010000, 1000000], "stable"),  # <2% change
+            # +20%: clearly positive appreciation and price change
+            ([1000000, 1100000, 1200000], "increasing", (1.0, math.inf), (1.0, math.inf)),
+            # -20%: clearly negative appreciation and price change
+            ([1200000, 1100000, 1000000], "decreasing", (-math.inf, -1.0), (-math.inf, -1.0)),
+            # <2% and <1% swings: both metrics stay within +/-2%
+            ([1000000, 1010000, 1000000], "stable", (-2.0, 2.0), (-2.0, 2.0)),
+            ([1000000, 1005000, 1000000], "stable", (-2.0, 2.0), (-2.0, 2.0)),
         ],
+        ids=["increasing", "decreasing", "stable_2pct", "stable_1pct"],
     )
-    def test_investment_analysis_price_trends(self, price_changes, expected_trend):
-        """Parametrized test for price trend detection."""
+    def test_investment_analysis_price_trends(
+        self, price_changes, expected_trend, rate_bounds, change_pct_bounds
+    ):
+        """Parametrized test for price trend detection and appreciation direction."""
         deals = [
-            Deal(objectid=i, deal_amount=price, deal_date=f"2024-{i + 1:02d}-01", asset_area=100)
+            Deal(objectid=i, deal_amount=price, deal_date=MONTH_STARTS_2024[i], asset_area=100)
             for i, price in enumerate(price_changes)
         ]
         analysis = analyze_investment_potential(deals)
 
         assert analysis.price_trend == expected_trend
+        assert rate_bounds[0] <= analysis.price_appreciation_rate <= rate_bounds[1]
+        assert change_pct_bounds[0] <= analysis.price_change_pct <= change_pct_bounds[1]
 
 
 class TestGetMarketLiquidity:
     """Test cases for get_market_liquidity function."""
 
-    def test_market_liquidity_basic(self):
+    def test_market_liquidity_basic(self, twelve_monthly_liquidity):
         """Test basic liquidity calculation."""
-        deals = [
-            Deal(
-                objectid=i,
-                deal_amount=1000000,
-                deal_date=get_recent_date(months_ago=i),
-                asset_area=80,
-            )
-            for i in range(12)
-        ]
-        liquidity = get_market_liquidity(deals, time_period_months=12)
+        liquidity = twelve_monthly_liquidity
 
         assert isinstance(liquidity, LiquidityMetrics)
         assert liquidity.total_deals == 12
@@ -499,18 +485,7 @@ class TestGetMarketLiquidity:
     def test_market_liquidity_very_high(self):
         """Test very high liquidity."""
         # 100 deals spread across last 10 months = ~10/month
-        deals = []
-        for i in range(100):
-            month_ago = i % 10
-            day = (i % 28) + 1
-            deals.append(
-                Deal(
-                    objectid=i,
-                    deal_amount=1000000,
-                    deal_date=get_recent_date(months_ago=month_ago, days_ago=day),
-                    asset_area=80,
-                )
-            )
+        deals = spread_deals(100, months=10)
         liquidity = get_market_liquidity(deals, time_period_months=12)
 
         assert liquidity.market_activity_level == "very_high"
@@ -537,19 +512,9 @@ class TestGetMarketLiquidity:
         assert liquidity.market_activity_level in ["very_low", "low"]
         assert liquidity.liquidity_score < 50
 
-    def test_market_liquidity_deal_velocity(self):
+    def test_market_liquidity_deal_velocity(self, twelve_monthly_liquidity):
         """Test deal velocity calculation."""
-        # 12 deals spread evenly across 12 months
-        deals = [
-            Deal(
-                objectid=i,
-                deal_amount=1000000,
-                deal_date=get_recent_date(months_ago=i),
-                asset_area=80,
-            )
-            for i in range(12)
-        ]
-        liquidity = get_market_liquidity(deals, time_period_months=12)
+        liquidity = twelve_monthly_liquidity
 
         # deal_velocity should equal avg_deals_per_month
         assert liquidity.deal_velocity == liquidity.avg_deals_per_month
@@ -572,18 +537,7 @@ class TestGetMarketLiquidity:
     )
     def test_market_liquidity_ratings(self, num_deals, months, expected_ratings):
         """Parametrized test for liquidity ratings."""
-        deals = []
-        for i in range(num_deals):
-            month_ago = i % months
-            day = (i // months) % 28
-            deals.append(
-                Deal(
-                    objectid=i,
-                    deal_amount=1000000,
-                    deal_date=get_recent_date(months_ago=month_ago, days_ago=day),
-                    asset_area=80,
-                )
-            )
+        deals = spread_deals(num_deals, months)
         liquidity = get_market_liquidity(deals, time_period_months=12)
 
         assert liquidity.market_activity_level in expected_ratings
@@ -5,6 +5,8 @@ This module tests all Pydantic model validation, serialization,
 and computed fields to ensure type safety and correctness.
 """
 
+import re
+
 from pydantic import ValidationError
 import pytest
 
@@ -20,37 +22,56 @@ from nadlan_mcp.govmap.models import (
     LiquidityMetrics,
     MarketActivityScore,
 )
+from nadlan_mcp.govmap.statistics import calculate_deal_statistics
+
+# Expected ValidationError messages, compiled once and shared by the tests below
+_FROZEN_RE = re.compile(r"Instance is frozen")
+_NOT_A_NUMBER_RE = re.compile(r"Input should be a valid number")
+_FIELD_REQUIRED_RE = re.compile(r"Field required")
+_ABOVE_100_RE = re.compile(r"less than or equal to 100")
+_NEGATIVE_RE = re.compile(r"greater than or equal to 0")
+_MAX_BELOW_MIN_RE = re.compile(r"max_(rooms|price|area|floor) must be >= min_\1")
+
+
+def assert_invalid(model, kwargs, field, message):
+    """Assert that model(**kwargs) fails on field alone, with an error matching message."""
+    with pytest.raises(ValidationError, match=message) as exc_info:
+        model(**kwargs)
+    assert [error["loc"] for error in exc_info.value.errors()] == [(field,)]
+
+
+@pytest.fixture(scope="module")
+def std_coord():
+    """Shared test coordinate; CoordinatePoint is frozen, so one instance serves every test."""
+    return CoordinatePoint(longitude=180000.0, latitude=650000.0)
 
 
 class TestCoordinatePoint:
     """Tests for CoordinatePoint model."""
 
-    def test_valid_coordinate(self):
+    def test_valid_coordinate(self, std_coord):
         """Test creating valid coordinate point."""
-        coord = CoordinatePoint(longitude=180000.0, latitude=650000.0)
-        assert coord.longitude == 180000.0
-        assert coord.latitude == 650000.0
+        assert std_coord.longitude == 180000.0
+        assert std_coord.latitude == 650000.0
 
-    def test_coordinate_immutable(self):
+    def test_coordinate_immutable(self, std_coord):
         """Test that coordinates are immutable (frozen)."""
-        coord = CoordinatePoint(longitude=180000.0, latitude=650000.0)
-        with pytest.raises(ValidationError):
-            coord.longitude = 180001.0
+        with pytest.raises(ValidationError, match=_FROZEN_RE):
+            std_coord.longitude = 180001.0
 
     def test_coordinate_invalid_type(self):
         """Test that invalid types raise ValidationError."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match=_NOT_A_NUMBER_RE):
             CoordinatePoint(longitude="invalid", latitude=650000.0)
 
 
 class TestAddress:
     """Tests for Address model."""
 
-    def test_valid_address(self):
+    def test_valid_address(self, std_coord):
         """Test creating valid address."""
-        coord = CoordinatePoint(longitude=180000.0, latitude=650000.0)
         address = Address(
-            text="סוקולוב 38 חולון", id="addr123", type="address", score=95.5, coordinates=coord
+            text="סוקולוב 38 חולון", id="addr123", type="address", score=95.5, coordinates=std_coord
         )
         assert address.text == "סוקולוב 38 חולון"
         assert address.score == 95.5
@@ -66,15 +87,14 @@ class TestAddress:
 class TestAutocompleteResult:
     """Tests for AutocompleteResult model."""
 
-    def test_valid_result_with_coordinates(self):
+    def test_valid_result_with_coordinates(self, std_coord):
         """Test autocomplete result with parsed coordinates."""
-        coord = CoordinatePoint(longitude=180000.0, latitude=650000.0)
         result = AutocompleteResult(
             text="חולון",
             id="city123",
             type="city",
             score=100.0,
-            coordinates=coord,
+            coordinates=std_coord,
             shape="POINT(180000.0 650000.0)",
         )
         assert result.text == "חולון"
@@ -192,7 +212,7 @@ class TestDeal:
 
     def test_deal_required_fields(self):
         """Test that required fields are enforced."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match=_FIELD_REQUIRED_RE):
             Deal(objectid=12345)  # Missing deal_amount and deal_date
 
 
@@ -238,20 +258,16 @@ class TestMarketActivityScore:
         assert score.trend == "increasing"
         assert score.monthly_distribution["2024-02"] == 12
 
-    def test_activity_score_bounds(self):
+    @pytest.mark.parametrize(
+        "activity_score,message",
+        [(150.0, _ABOVE_100_RE), (-10.0, _NEGATIVE_RE)],
+        ids=["above_100", "below_0"],
+    )
+    def test_activity_score_bounds(self, activity_score, message):
         """Test that activity_score is bounded 0-100."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match=message):
             MarketActivityScore(
-                activity_score=150.0,  # Invalid: > 100
-                total_deals=100,
-                deals_per_month=8.0,
-                trend="stable",
-                time_period_months=12,
-            )
-
-        with pytest.raises(ValidationError):
-            MarketActivityScore(
-                activity_score=-10.0,  # Invalid: < 0
+                activity_score=activity_score,
                 total_deals=100,
                 deals_per_month=8.0,
                 trend="stable",
@@ -281,7 +297,7 @@ class TestInvestmentAnalysis:
 
     def test_investment_score_bounds(self):
         """Test that investment_score is bounded 0-100."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match=_ABOVE_100_RE):
             InvestmentAnalysis(
                 investment_score=105.0,  # Invalid
                 price_trend="stable",
@@ -339,33 +355,39 @@ class TestDealFilters:
         assert filters.property_type is None
         assert filters.min_rooms is None
 
-    def test_filter_validation_max_rooms(self):
-        """Test that max_rooms must be >= min_rooms."""
-        with pytest.raises(ValidationError):
-            DealFilters(min_rooms=4.0, max_rooms=2.0)
-
-    def test_filter_validation_max_price(self):
-        """Test that max_price must be >= min_price."""
-        with pytest.raises(ValidationError):
-            DealFilters(min_price=2000000.0, max_price=1000000.0)
-
-    def test_filter_validation_max_area(self):
-        """Test that max_area must be >= min_area."""
-        with pytest.raises(ValidationError):
-            DealFilters(min_area=100.0, max_area=60.0)
-
-    def test_filter_validation_max_floor(self):
-        """Test that max_floor must be >= min_floor."""
-        with pytest.raises(ValidationError):
-            DealFilters(min_floor=5, max_floor=1)
-
-    def test_filter_negative_values(self):
-        """Test that negative values are rejected."""
-        with pytest.raises(ValidationError):
-            DealFilters(min_rooms=-1.0)
-
-        with pytest.raises(ValidationError):
-            DealFilters(min_price=-1000.0)
+    @pytest.mark.parametrize(
+        "kwargs,field",
+        [
+            ({"min_rooms": 4.0, "max_rooms": 2.0}, "max_rooms"),
+            ({"min_price": 2000000.0, "max_price": 1000000.0}, "max_price"),
+            ({"min_area": 100.0, "max_area": 60.0}, "max_area"),
+            ({"min_floor": 5, "max_floor": 1}, "max_floor"),
+        ],
+        ids=["rooms", "price", "area", "floor"],
+    )
+    def test_filter_validation_max_below_min(self, kwargs, field):
+        """Test that each max_* bound must be >= its min_* bound."""
+        assert_invalid(DealFilters, kwargs, field, _MAX_BELOW_MIN_RE)
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("min_rooms", -1.0),
+            ("max_rooms", -1.0),
+            ("min_price", -1000.0),
+            ("max_price", -1000.0),
+            ("min_area", -5.0),
+            ("max_area", -5.0),
+        ],
+    )
+    def test_filter_negative_values(self, field, value):
+        """Test that negative room, price and area bounds are rejected."""
+        assert_invalid(DealFilters, {field: value}, field, _NEGATIVE_RE)
+
+    def test_filter_negative_floors_allowed(self):
+        """Test that floor bounds may be negative (basement levels)."""
+        filters = DealFilters(min_floor=-2, max_floor=-1)
+        assert filters.min_floor == -2
 
 
 class TestModelIntegration:
@@ -373,9 +395,6 @@ class TestModelIntegration:
 
     def test_deal_to_statistics_workflow(self):
         """Test creating deals and calculating statistics."""
-        # Import the function to test integration
-        from nadlan_mcp.govmap.statistics import calculate_deal_statistics
-
         deals = [
             Deal(
                 objectid=1,
@@ -401,12 +420,30 @@ class TestModelIntegration:
         assert stats.price_per_sqm_statistics["mean"] == 15000.0
         assert stats.property_type_distribution["דירה"] == 2
 
-    def test_autocomplete_to_deals_workflow(self):
+    def test_statistics_workflow_at_scale(self):
+        """Test that statistics over 1000 deals aggregate every deal correctly."""
+        deals = [
+            Deal(
+                objectid=i,
+                deal_amount=1000000.0 + i,
+                deal_date="2024-01-01",
+                asset_area=100.0,
+                property_type_description="דירה",
+            )
+            for i in range(1000)
+        ]
+
+        stats = calculate_deal_statistics(deals)
+
+        assert stats.total_deals == 1000
+        assert stats.price_statistics["mean"] == 1000499.5
+        assert stats.property_type_distribution["דירה"] == 1000
+
+    def test_autocomplete_to_deals_workflow(self, std_coord):
         """Test autocomplete response leading to deal search."""
         # Simulate autocomplete response
-        coord = CoordinatePoint(longitude=180000.0, latitude=650000.0)
         result = AutocompleteResult(
-            text="סוקולוב 38 חולון", id="addr123", type="address", coordinates=coord
+            text="סוקולוב 38 חולון", id="addr123", type="address", coordinates=std_coord
         )
         response = AutocompleteResponse(resultsCount=1, results=[result])
 
@@ -424,18 +461,18 @@ class TestModelIntegration:
             max_price=2000000.0,
         )
 
-        # Create test deals
+        # (deal_amount, rooms) pairs; the bounds are plain numbers, so no Deal is needed
         deals = [
-            Deal(objectid=1, deal_amount=1200000.0, deal_date="2024-01-01", rooms=3.0),
-            Deal(
-                objectid=2, deal_amount=2500000.0, deal_date="2024-01-02", rooms=4.0
-            ),  # Price too high
-            Deal(
-                objectid=3, deal_amount=1500000.0, deal_date="2024-01-03", rooms=2.0
-            ),  # Too few rooms
+            (1200000.0, 3.0),
+            (2500000.0, 4.0),  # Price too high
+            (1500000.0, 2.0),  # Too few rooms
         ]
 
         # Manually check which deals would pass
         # (actual filtering is done by filter_deals_by_criteria function)
-        assert filters.min_rooms <= deals[0].rooms <= filters.max_rooms
-        assert filters.min_price <= deals[0].deal_amount <= filters.max_price
+        passing = [
+            filters.min_price <= amount <= filters.max_price
+            and filters.min_rooms <= rooms <= filters.max_rooms
+            for amount, rooms in deals
+        ]
+        assert passing == [True, False, False]
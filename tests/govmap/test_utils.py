@@ -199,6 +199,13 @@ class TestExtractFloorNumber:
         """Test extraction of tenth floor (עשירית)."""
         assert extract_floor_number("עשירית") == 10
 
+    def test_repeated_description_is_parsed_once(self):
+        """Test that a repeated floor description is served from the cache."""
+        extract_floor_number.cache_clear()
+        for _ in range(3):
+            assert extract_floor_number("קומה 7") == 7
+        assert extract_floor_number.cache_info().hits == 2
+
     # Test numeric strings
     def test_numeric_string(self):
         """Test extraction from numeric string."""
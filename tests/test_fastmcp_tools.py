@@ -74,6 +74,15 @@ class TestAutocompleteAddress:
         # With empty results, returns a message string
         assert "No addresses found" in result
 
+    @patch("nadlan_mcp.fastmcp_server.client")
+    def test_autocomplete_blank_search_skips_api(self, mock_client):
+        """Test that empty or too-short input is rejected without calling Govmap."""
+        for search_text in ("", "   ", " א "):
+            result = fastmcp_server.autocomplete_address(search_text)
+            assert "at least 2 characters" in result
+
+        mock_client.autocomplete_address.assert_not_called()
+
     @patch("nadlan_mcp.fastmcp_server.client")
     def test_autocomplete_invalid_coordinates(self, mock_client):
         """Test autocomplete with invalid/missing coordinate format."""
@@ -161,13 +170,21 @@ class TestGetDealsByRadius:
         assert parsed["total_polygons"] == 1
         mock_client.get_deals_by_radius.assert_called_once()
 
+    @patch("nadlan_mcp.fastmcp_server.client")
+    def test_get_deals_non_positive_radius_skips_api(self, mock_client):
+        """Test that a non-positive radius is rejected without calling Govmap."""
+        result = fastmcp_server.get_deals_by_radius(650000.0, 180000.0, 0)
+
+        assert "radius_meters must be positive" in result
+        mock_client.get_deals_by_radius.assert_not_called()
+
     @patch("nadlan_mcp.fastmcp_server.client")
     def test_get_deals_no_results(self, mock_client):
         """Test polygon metadata retrieval with no results."""
         mock_client.get_deals_by_radius.return_value = []
 
         result = fastmcp_server.get_deals_by_radius(650000.0, 180000.0, 500)
-        assert "No polygons found" in result
+        assert result == "No polygons found within 500m of coordinates (650000.0, 180000.0)"
 
     @patch("nadlan_mcp.fastmcp_server.client")
     def test_get_deals_strips_bloat_fields(self, mock_client):
@@ -336,6 +353,66 @@ class TestAnalyzeMarketTrends:
         assert "yearly_trends" in parsed
         assert "top_property_types" in parsed
 
+    @patch("nadlan_mcp.fastmcp_server.client")
+    def test_yearly_trends_aggregation(self, mock_client):
+        """Test yearly trend counts, averages and min/max per year."""
+        mock_client.autocomplete_address.return_value = self._mock_autocomplete()
+
+        mock_deals = [
+            Deal(objectid=1, deal_amount=1000000, deal_date="2023-03-01", asset_area=100.0),
+            Deal(objectid=2, deal_amount=1500000, deal_date="2023-07-01", asset_area=100.0),
+            Deal(objectid=3, deal_amount=2400000, deal_date="2024-02-01", asset_area=120.0),
+        ]
+        mock_deals[0].deal_source = "same_building"
+        mock_deals[1].deal_source = "street"
+        mock_deals[2].deal_source = "neighborhood"
+        mock_client.find_recent_deals_for_address.return_value = mock_deals
+
+        result = fastmcp_server.analyze_market_trends("test", 2, 100)
+        parsed = json.loads(result)
+
+        year_2023 = parsed["yearly_trends"]["2023"]
+        assert year_2023["deal_count"] == 2
+        assert year_2023["same_building_deals"] == 1
+        assert year_2023["street_deals"] == 1
+        assert year_2023["avg_price"] == 1250000
+        assert year_2023["avg_price_per_sqm"] == 12500
+        assert year_2023["min_price_per_sqm"] == 10000
+        assert year_2023["max_price_per_sqm"] == 15000
+        assert year_2023["total_volume"] == 2500000
+
+        year_2024 = parsed["yearly_trends"]["2024"]
+        assert year_2024["deal_count"] == 1
+        assert year_2024["street_deals"] == 0
+        assert year_2024["avg_price_per_sqm"] == 20000
+
+    @patch("nadlan_mcp.fastmcp_server.client")
+    def test_top_property_types_ranked_by_count(self, mock_client):
+        """Test property types are ranked by deal count and single-deal types dropped."""
+        mock_client.autocomplete_address.return_value = self._mock_autocomplete()
+
+        type_counts = {"דירה": 3, "פנטהאוז": 2, "קוטג'": 1}
+        mock_deals = []
+        for prop_type, count in type_counts.items():
+            for _ in range(count):
+                mock_deals.append(
+                    Deal(
+                        objectid=len(mock_deals) + 1,
+                        deal_amount=1000000,
+                        deal_date="2024-01-01",
+                        asset_area=100.0,
+                        property_type_description=prop_type,
+                    )
+                )
+        mock_client.find_recent_deals_for_address.return_value = mock_deals
+
+        result = fastmcp_server.analyze_market_trends("test", 2, 100)
+        top_types = json.loads(result)["top_property_types"]
+
+        assert list(top_types) == ["דירה", "פנטהאוז"]
+        assert top_types["דירה"]["deal_count"] == 3
+        assert top_types["דירה"]["avg_price_per_sqm"] == 10000
+
     @patch("nadlan_mcp.fastmcp_server.client")
     def test_market_analysis_no_data(self, mock_client):
         """Test market analysis with no data."""
@@ -354,11 +431,17 @@ class TestCompareAddresses:
     @patch("nadlan_mcp.fastmcp_server.client")
     def test_successful_comparison(self, mock_client):
         """Test successful address comparison."""
-        # Mock different deals for each address
-        mock_client.find_recent_deals_for_address.side_effect = [
-            [{"dealAmount": 2000000, "assetArea": 80, "price_per_sqm": 25000}],
-            [{"dealAmount": 1500000, "assetArea": 60, "price_per_sqm": 25000}],
-        ]
+        # Mock different deals for each address (keyed by address, since the
+        # addresses are looked up concurrently)
+        deals_by_address = {
+            "דיזנגוף 50 תל אביב": [
+                {"dealAmount": 2000000, "assetArea": 80, "price_per_sqm": 25000}
+            ],
+            "הרצל 1 חולון": [{"dealAmount": 1500000, "assetArea": 60, "price_per_sqm": 25000}],
+        }
+        mock_client.find_recent_deals_for_address.side_effect = lambda address, years_back: (
+            deals_by_address[address]
+        )
 
         result = fastmcp_server.compare_addresses(["דיזנגוף 50 תל אביב", "הרצל 1 חולון"])
         parsed = json.loads(result)
@@ -367,6 +450,19 @@ class TestCompareAddresses:
         assert parsed["addresses_compared"] == 2
         assert "all_results" in parsed
 
+    @patch("nadlan_mcp.fastmcp_server.client")
+    def test_results_keep_input_order(self, mock_client):
+        """Test that concurrent lookups still report addresses in the order given."""
+        addresses = [f"הרצל {number} חולון" for number in range(1, 7)]
+        mock_client.autocomplete_address.return_value.results = []
+        mock_client.find_recent_deals_for_address.return_value = []
+
+        result = fastmcp_server.compare_addresses(addresses)
+        parsed = json.loads(result)
+
+        assert [item["address"] for item in parsed["all_results"]] == addresses
+        assert mock_client.find_recent_deals_for_address.call_count == len(addresses)
+
     @patch("nadlan_mcp.fastmcp_server.client")
     def test_comparison_error_handling(self, mock_client):
         """Test error handling in address comparison."""
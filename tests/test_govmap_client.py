@@ -4,9 +4,12 @@ Tests for the GovmapClient class.
 Updated for Phase 4.1 - Pydantic models integration.
 """
 
+import json
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
 from nadlan_mcp.config import GovmapConfig
 from nadlan_mcp.govmap import GovmapClient
@@ -31,24 +34,47 @@ class TestGovmapClient:
         client = GovmapClient(custom_config)
         assert client.base_url == "https://custom-api.example.com/api"
 
+    @patch("nadlan_mcp.govmap.client.time.sleep")
+    @patch("nadlan_mcp.govmap.client.time.time", return_value=1000.0)
+    def test_rate_limit_spaces_concurrent_callers(self, mock_time, mock_sleep):
+        """Test that threads sharing the client each get their own request slot."""
+        client = GovmapClient(GovmapConfig(requests_per_second=10))
+
+        threads = [threading.Thread(target=client._rate_limit) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # The clock is frozen, so the slots are exact: the first caller takes "now",
+        # the other two reserve the next two 0.1s slots and sleep until them
+        first_slot = 1000.0
+        second_slot = first_slot + 0.1
+        third_slot = second_slot + 0.1
+        waits = sorted(call.args[0] for call in mock_sleep.call_args_list)
+        assert waits == [second_slot - 1000.0, third_slot - 1000.0]
+        assert client.last_request_time == third_slot
+
     @patch("requests.Session")
     def test_autocomplete_address_success(self, mock_session_class):
         """Test successful address autocomplete."""
         # Mock response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "resultsCount": 1,
-            "results": [
-                {
-                    "id": "address|ADDR|123|test",
-                    "text": "תל אביב",
-                    "type": "address",
-                    "score": 100,
-                    "shape": "POINT(3870000.123 3770000.456)",
-                    "data": {},
-                }
-            ],
-        }
+        mock_response.content = json.dumps(
+            {
+                "resultsCount": 1,
+                "results": [
+                    {
+                        "id": "address|ADDR|123|test",
+                        "text": "תל אביב",
+                        "type": "address",
+                        "score": 100,
+                        "shape": "POINT(3870000.123 3770000.456)",
+                        "data": {},
+                    }
+                ],
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         mock_session = Mock()
@@ -71,7 +97,7 @@ class TestGovmapClient:
     def test_autocomplete_address_empty_results(self, mock_session_class):
         """Test autocomplete with empty results - should return empty results, not raise error."""
         mock_response = Mock()
-        mock_response.json.return_value = {"resultsCount": 0, "results": []}
+        mock_response.content = json.dumps({"resultsCount": 0, "results": []}).encode()
         mock_response.raise_for_status.return_value = None
 
         mock_session = Mock()
@@ -89,7 +115,8 @@ class TestGovmapClient:
     def test_autocomplete_address_invalid_response(self, mock_session_class):
         """Test autocomplete with truly invalid response format."""
         mock_response = Mock()
-        mock_response.json.return_value = {"invalid": "response"}  # Missing 'results' key
+        # Missing 'results' key
+        mock_response.content = json.dumps({"invalid": "response"}).encode()
         mock_response.raise_for_status.return_value = None
 
         mock_session = Mock()
@@ -101,6 +128,26 @@ class TestGovmapClient:
         with pytest.raises(ValueError, match="Invalid response format"):
             client.autocomplete_address("test")
 
+    @patch("requests.Session")
+    def test_autocomplete_address_malformed_json_is_retried(self, mock_session_class):
+        """Test that an undecodable body is treated as a retryable request failure."""
+        mock_response = Mock()
+        mock_response.content = b"<html>Service Unavailable</html>"
+        mock_response.text = "<html>Service Unavailable</html>"
+        mock_response.raise_for_status.return_value = None
+
+        mock_session = Mock()
+        mock_session.post.return_value = mock_response
+        mock_session_class.return_value = mock_session
+
+        client = GovmapClient(GovmapConfig(max_retries=1, retry_min_wait=1))
+
+        with patch("nadlan_mcp.govmap.client.time.sleep"), pytest.raises(
+            requests.exceptions.JSONDecodeError
+        ):
+            client.autocomplete_address("test")
+        assert mock_session.post.call_count == 2
+
     def test_coordinate_parsing_from_wkt_point(self):
         """Test coordinate parsing from WKT POINT format."""
         client = GovmapClient()
@@ -133,16 +180,18 @@ class TestGovmapClient:
         """Test successful polygon metadata retrieval by radius."""
         mock_response = Mock()
         # API returns polygon metadata (not actual deals)
-        mock_response.json.return_value = [
-            {
-                "objectid": 12345,
-                "dealscount": "30",
-                "settlementNameHeb": "תל אביב-יפו",
-                "streetNameHeb": "דיזנגוף",
-                "houseNum": 50,
-                "polygon_id": "123-456",
-            }
-        ]
+        mock_response.content = json.dumps(
+            [
+                {
+                    "objectid": 12345,
+                    "dealscount": "30",
+                    "settlementNameHeb": "תל אביב-יפו",
+                    "streetNameHeb": "דיזנגוף",
+                    "houseNum": 50,
+                    "polygon_id": "123-456",
+                }
+            ]
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         mock_session = Mock()
@@ -163,19 +212,21 @@ class TestGovmapClient:
     def test_get_street_deals_success(self, mock_session_class):
         """Test successful street deals query."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "totalCount": "1",
-            "data": [
-                {
-                    "objectid": 123,
-                    "dealAmount": 1000000,
-                    "dealDate": "2025-01-01T00:00:00.000Z",
-                    "assetArea": 100,
-                    "settlementNameHeb": "תל אביב-יפו",
-                    "propertyTypeDescription": "דירה",
-                }
-            ],
-        }
+        mock_response.content = json.dumps(
+            {
+                "totalCount": "1",
+                "data": [
+                    {
+                        "objectid": 123,
+                        "dealAmount": 1000000,
+                        "dealDate": "2025-01-01T00:00:00.000Z",
+                        "assetArea": 100,
+                        "settlementNameHeb": "תל אביב-יפו",
+                        "propertyTypeDescription": "דירה",
+                    }
+                ],
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         mock_session = Mock()
@@ -197,19 +248,21 @@ class TestGovmapClient:
     def test_get_neighborhood_deals_success(self, mock_session_class):
         """Test successful neighborhood deals query."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "totalCount": "1",
-            "data": [
-                {
-                    "objectid": 456,
-                    "dealAmount": 2000000,
-                    "dealDate": "2025-01-15T00:00:00.000Z",
-                    "assetArea": 120,
-                    "settlementNameHeb": "תל אביב-יפו",
-                    "propertyTypeDescription": "דירה",
-                }
-            ],
-        }
+        mock_response.content = json.dumps(
+            {
+                "totalCount": "1",
+                "data": [
+                    {
+                        "objectid": 456,
+                        "dealAmount": 2000000,
+                        "dealDate": "2025-01-15T00:00:00.000Z",
+                        "assetArea": 120,
+                        "settlementNameHeb": "תל אביב-יפו",
+                        "propertyTypeDescription": "דירה",
+                    }
+                ],
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         mock_session = Mock()
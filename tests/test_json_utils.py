@@ -0,0 +1,50 @@
+"""
+Tests for the JSON backend helpers.
+"""
+
+import json
+
+from nadlan_mcp.json_utils import JSON_BACKEND, dumps, loads
+
+
+class TestJsonUtils:
+    """Test loads/dumps behave the same whichever backend is installed."""
+
+    def test_backend_is_known(self):
+        """Test that a supported backend was selected at import time."""
+        assert JSON_BACKEND in ("orjson", "ujson", "json")
+
+    def test_loads_accepts_bytes_and_str(self):
+        """Test decoding from both raw response bytes and text."""
+        payload = {"city": "תל אביב", "deals": [1, 2.5, None]}
+        encoded = json.dumps(payload, ensure_ascii=False)
+
+        assert loads(encoded) == payload
+        assert loads(encoded.encode("utf-8")) == payload
+
+    def test_dumps_keeps_hebrew_unescaped(self):
+        """Test that Hebrew text is emitted as-is rather than \\u escapes."""
+        result = dumps({"street": "סוקולוב"})
+
+        assert isinstance(result, str)
+        assert "סוקולוב" in result
+        assert json.loads(result) == {"street": "סוקולוב"}
+
+    def test_dumps_round_trip(self):
+        """Test that nested tool payloads survive a round trip."""
+        payload = {
+            "total_deals": 2,
+            "market_statistics": {"average": 1500000.5, "count": 2},
+            "deals": [{"objectid": 1}, {"objectid": 2}],
+        }
+
+        assert json.loads(dumps(payload)) == payload
+
+    def test_dumps_leaves_forward_slashes_unescaped(self):
+        """Test that URLs and paths serialize identically on every backend (no \\/)."""
+        payload = {"url": "https://www.govmap.gov.il/api/", "date": "01/2024"}
+        result = dumps(payload)
+
+        assert "\\/" not in result
+        assert "https://www.govmap.gov.il/api/" in result
+        assert json.loads(result) == payload